@@ -10,11 +10,14 @@ by the Government of Aragon, created by Sergio Palao.
 import json
 import os
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from importlib import resources
+from itertools import islice
 from pathlib import Path
 from typing import Optional
-from urllib.request import urlopen, Request
-from urllib.error import URLError
+from urllib.error import HTTPError
+from urllib.parse import quote
 
 import gettext
 _ = gettext.gettext
@@ -25,7 +28,9 @@ gi.require_version('Adw', '1')
 gi.require_version('GdkPixbuf', '2.0')
 from gi.repository import Gtk, Adw, Gio, GLib, Gdk, GdkPixbuf
 
-from bildstod.library import get_images_dir, PictureLibrary
+from bildstod import json_helper
+from bildstod.http_pool import open_url
+from bildstod.library import get_images_dir, get_thumbnails_dir, PictureLibrary
 
 API_BASE = "https://api.arasaac.org/v1"
 IMAGE_BASE = "https://static.arasaac.org/pictograms"
@@ -35,18 +40,36 @@ ATTRIBUTION = (
     "licensed under CC BY-NC-SA 3.0"
 )
 
+# Shared worker pool for thumbnail and pictogram downloads
+_IO_POOL = ThreadPoolExecutor(max_workers=6, thread_name_prefix="arasaac-io")
+
+# Downloads in progress, so concurrent requests for one image share a fetch
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Downloaded pictograms older than this are revalidated with their ETag
+REVALIDATE_AFTER = 30 * 24 * 3600
+
+# Per directory, the downloaded pictograms that can be used without a stat
+# or revalidation: {dir: {filename}}
+_KNOWN_FILES = {}
+_KNOWN_LOCK = threading.Lock()
+
+# Letters that only occur in Swedish queries
+_SV_CHARS = frozenset("åäöÅÄÖ")
+
 
 def _load_json_data(filename: str) -> dict:
     """Load a JSON data file bundled with the package."""
     try:
         ref = resources.files("bildstod").joinpath("data").joinpath(filename)
-        return json.loads(ref.read_text(encoding="utf-8"))
+        return json_helper.loads(ref.read_bytes())
     except (TypeError, FileNotFoundError, ModuleNotFoundError):
         pass
     data_dir = Path(__file__).parent / "data"
     data_file = data_dir / filename
     if data_file.exists():
-        return json.loads(data_file.read_text(encoding="utf-8"))
+        return json_helper.loads(data_file.read_bytes())
     return {}
 
 
@@ -56,10 +79,15 @@ _sv2en = None      # {sv_term: [en_terms]}
 
 
 def _get_en2sv():
-    """Load English → Swedish ordlista."""
+    """Load English → Swedish ordlista, keyed by lowercase English term."""
     global _en2sv
     if _en2sv is None:
-        _en2sv = _load_json_data("arasaac_en2sv.json")
+        en2sv = {}
+        for en_term, sv_term in _load_json_data("arasaac_en2sv.json").items():
+            key = en_term.lower()
+            if key == en_term or key not in en2sv:
+                en2sv[key] = sv_term
+        _en2sv = en2sv
     return _en2sv
 
 
@@ -96,11 +124,10 @@ def _api_search(keyword, lang="en"):
         pass
     
     # Make API call
-    encoded = __import__('urllib.parse', fromlist=['quote']).quote(keyword)
+    encoded = quote(keyword)
     url = f"{API_BASE}/pictograms/{lang}/search/{encoded}"
     try:
-        req = Request(url, headers={"User-Agent": "Bildstod/0.4.8"})
-        with urlopen(req, timeout=10) as resp:
+        with open_url(url, timeout=10) as resp:
             data = json.loads(resp.read())
             if isinstance(data, list):
                 # Cache the results
@@ -116,40 +143,52 @@ def _api_search(keyword, lang="en"):
     return []
 
 
+def search_pictograms_bulk(keywords, lang="en"):
+    """Search several keywords at once. Returns {keyword: results}.
+
+    The searches run in parallel on the shared download pool, so the total
+    wait is roughly that of the slowest request instead of their sum.
+    """
+    keywords = list(dict.fromkeys(keywords))
+    found = _IO_POOL.map(lambda kw: _api_search(kw, lang=lang), keywords)
+    return dict(zip(keywords, found))
+
+
 def search_pictograms_sv(keyword):
     """Search Swedish keyword using intelligent strategy."""
     sv_term = keyword.lower().strip()
     results = []
     seen_ids = set()
     
-    # Strategy 1: Try Swedish directly
-    swedish_results = _api_search(keyword, lang="sv")
-    for result in swedish_results[:30]:  # Limit Swedish results
-        picto_id = result.get("_id")
-        if picto_id and picto_id not in seen_ids:
-            seen_ids.add(picto_id)
-            result["swedish_keyword"] = keyword
-            results.append(result)
-    
-    # Strategy 2: Find English equivalents
-    sv2en = _get_sv2en()
-    if sv_term in sv2en:
-        english_terms = sv2en[sv_term]
-        for en_term in english_terms[:3]:  # Limit English terms
-            english_results = _api_search(en_term, lang="en")
-            for result in english_results[:10]:  # Limit per English term
-                picto_id = result.get("_id")
-                if picto_id and picto_id not in seen_ids:
-                    seen_ids.add(picto_id)
-                    result["swedish_keyword"] = keyword
-                    results.append(result)
-                
+    # Find English equivalents
+    english_terms = _get_sv2en().get(sv_term, [])[:3]  # Limit English terms
+
+    # The Swedish search and its English fallbacks are independent, so
+    # they are all sent at once
+    swedish_future = _IO_POOL.submit(_api_search, keyword, lang="sv")
+    english_by_term = search_pictograms_bulk(english_terms, lang="en")
+
+    def add_results(candidates, limit):
+        # Results are tagged in place and kept, so no copies are made
+        for result in islice(candidates, limit):
+            picto_id = result.get("_id")
+            if picto_id and picto_id not in seen_ids:
+                seen_ids.add(picto_id)
+                result["swedish_keyword"] = keyword
+                results.append(result)
                 if len(results) >= 60:
-                    break
-            if len(results) >= 60:
-                break
-    
-    return results[:60]
+                    return
+
+    # Strategy 1: Try Swedish directly
+    add_results(swedish_future.result(), 30)  # Limit Swedish results
+
+    # Strategy 2: English equivalents
+    for en_term in english_terms:
+        if len(results) >= 60:
+            break
+        add_results(english_by_term.get(en_term, ()), 10)  # Limit per term
+
+    return results
 
 
 def search_pictograms(keyword, lang="sv"):
@@ -178,6 +217,32 @@ def get_image_url(pictogram_id, size=500):
     return f"{IMAGE_BASE}/{pictogram_id}/{pictogram_id}_{size}.png"
 
 
+def _known_files(dest_dir):
+    """Return the set of usable pictogram filenames in *dest_dir*.
+
+    The directory is listed once; files with an ETag sidecar are left out
+    so that they still go through revalidation.
+    """
+    with _KNOWN_LOCK:
+        known = _KNOWN_FILES.get(dest_dir)
+        if known is None:
+            try:
+                names = set(os.listdir(dest_dir))
+            except OSError:
+                names = set()
+            known = {name for name in names
+                     if name.startswith("arasaac_") and name.endswith(".png")
+                     and name[:-4] + ".etag" not in names}
+            _KNOWN_FILES[dest_dir] = known
+        return known
+
+
+def forget_known_files():
+    """Drop the downloaded file listings, e.g. after files were removed."""
+    with _KNOWN_LOCK:
+        _KNOWN_FILES.clear()
+
+
 def download_image(pictogram_id, dest_dir=None, size=500):
     """Download pictogram image with offline cache support."""
     # Try offline cache first
@@ -198,20 +263,75 @@ def download_image(pictogram_id, dest_dir=None, size=500):
     # Fallback to legacy behavior for backward compatibility
     if dest_dir is None:
         dest_dir = get_images_dir()
-    dest = Path(dest_dir) / f"arasaac_{pictogram_id}.png"
-    if dest.exists():
+    dest_dir = os.fspath(dest_dir)
+    fname = f"arasaac_{pictogram_id}.png"
+    known = _known_files(dest_dir)
+    if fname in known:
+        return os.path.join(dest_dir, fname)
+    dest = Path(dest_dir) / fname
+    try:
+        age = time.time() - dest.stat().st_mtime
+    except OSError:
+        age = None
+    if age is not None and (age < REVALIDATE_AFTER
+                            or not dest.with_suffix(".etag").exists()):
+        with _KNOWN_LOCK:
+            known.add(fname)
         return str(dest)
     
-    # Download image
+    # Join a download of the same image that is already running
+    key = (pictogram_id, size, str(dest))
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        if future is not None:
+            owner = False
+        else:
+            owner = True
+            future = _INFLIGHT[key] = Future()
+    if not owner:
+        return future.result()
+    
+    path = None
+    try:
+        path = _fetch_image(pictogram_id, dest, size)
+        if path is not None:
+            with _KNOWN_LOCK:
+                known.add(fname)
+    finally:
+        future.set_result(path)
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+    return path
+
+
+def _fetch_image(pictogram_id, dest, size):
+    """Download a pictogram to *dest*. Returns the path or None on failure.
+
+    If *dest* already exists it is revalidated with If-None-Match and only
+    rewritten when the server has a newer image.
+    """
     url = get_image_url(pictogram_id, size)
+    # Write next to the destination first so that readers never see a
+    # partially written PNG
+    tmp = dest.with_suffix(f".{size}.part")
+    etag_path = dest.with_suffix(".etag")
+    headers = {}
+    if dest.exists():
+        try:
+            headers["If-None-Match"] = etag_path.read_text().strip()
+        except OSError:
+            pass
     try:
-        req = Request(url, headers={"User-Agent": "Bildstod/0.4.8"})
-        with urlopen(req, timeout=15) as resp:
+        with open_url(url, headers=headers, timeout=15) as resp:
             image_data = resp.read()
             
             # Save to legacy location
-            with open(dest, "wb") as f:
+            with open(tmp, "wb") as f:
                 f.write(image_data)
+            os.replace(tmp, dest)
+            etag = resp.headers.get("ETag")
+            if etag:
+                etag_path.write_text(etag)
             
             # Also save to cache
             try:
@@ -222,8 +342,48 @@ def download_image(pictogram_id, dest_dir=None, size=500):
                 pass
             
             return str(dest)
+    except HTTPError as e:
+        if e.code == 304:
+            # Unchanged on the server; restart the revalidation period
+            try:
+                os.utime(dest)
+            except OSError:
+                pass
+            return str(dest)
     except Exception:
+        pass
+    try:
+        tmp.unlink()
+    except OSError:
+        pass
+    # A stale copy is better than no image at all
+    return str(dest) if dest.exists() else None
+
+
+def _thumb_path(pictogram_id, side=96):
+    return get_thumbnails_dir() / f"arasaac_{pictogram_id}_{side}.png"
+
+
+def get_or_make_thumb(pictogram_id, side=96):
+    """Return a side×side thumbnail of a pictogram, creating it on first use.
+
+    The grid shows pictograms at 96 px, so a pre-scaled copy saves decoding
+    and scaling the 300 px download every time a card is shown.
+    """
+    thumb = _thumb_path(pictogram_id, side)
+    if thumb.exists():
+        return str(thumb)
+    src = download_image(pictogram_id, size=300)
+    if not src:
         return None
+    try:
+        pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(src, side, side, True)
+        tmp = thumb.with_suffix(".part")
+        pixbuf.savev(str(tmp), "png", [], [])
+        os.replace(tmp, thumb)
+    except (GLib.Error, OSError):
+        return src
+    return str(thumb)
 
 
 def get_best_keyword(pictogram, lang="sv"):
@@ -232,21 +392,30 @@ def get_best_keyword(pictogram, lang="sv"):
     if "swedish_keyword" in pictogram:
         return pictogram["swedish_keyword"]
     
-    # Try to find Swedish keyword in pictogram data
-    for kw in pictogram.get("keywords", []):
-        if kw.get("locale") == "sv":
-            return kw.get("keyword", "")
-    
-    # Try translating English keyword to Swedish
+    # Cards and the Add button both ask, so remember the answer
+    best = pictogram.get("_best_keyword")
+    if best is None:
+        best = pictogram["_best_keyword"] = _find_best_keyword(pictogram)
+    return best
+
+
+def _find_best_keyword(pictogram):
+    """Pick a label from the pictogram's keywords in a single pass."""
+    keywords = pictogram.get("keywords", [])
     en2sv = _get_en2sv()
-    for kw in pictogram.get("keywords", []):
-        if kw.get("locale") == "en":
-            en_word = kw.get("keyword", "").lower()
-            if en_word in en2sv:
-                return en2sv[en_word]
+    translated = None
+    for kw in keywords:
+        locale = kw.get("locale")
+        # A Swedish keyword in the pictogram data wins outright
+        if locale == "sv":
+            return kw.get("keyword", "")
+        # Otherwise remember the first English keyword we can translate
+        if translated is None and locale == "en":
+            translated = en2sv.get(kw.get("keyword", "").lower())
+    if translated is not None:
+        return translated
     
     # Fallback to any keyword
-    keywords = pictogram.get("keywords", [])
     if keywords:
         return keywords[0].get("keyword", "")
     
@@ -261,6 +430,10 @@ class ArasaacSearchView(Gtk.Box):
         self.library = library
         self.status_callback = status_callback
         self._results = []
+        # Thumbnail downloads for the current results, and a counter that
+        # lets late results from an earlier search be recognised and dropped
+        self._pending = []
+        self._search_gen = 0
 
         # Search bar
         search_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -324,11 +497,10 @@ class ArasaacSearchView(Gtk.Box):
 
     def _detect_language(self, query):
         """Simple heuristic: if query contains åäö, it's Swedish."""
-        swedish_chars = set('åäöÅÄÖ')
-        if any(c in swedish_chars for c in query):
+        if not query.isascii() and any(c in _SV_CHARS for c in query):
             return "sv"
         # Check if the term exists in Swedish lookup
-        lookup = _get_sv_lookup()
+        lookup = _get_sv2en()
         if query.lower().strip() in lookup:
             return "sv"
         return "en"
@@ -345,15 +517,18 @@ class ArasaacSearchView(Gtk.Box):
         self.info_label.set_visible(True)
 
         lang = self._detect_language(query)
+        gen = self._search_gen
 
         def do_search():
             results = search_pictograms(query, lang=lang)
-            GLib.idle_add(self._on_results, results, query, lang)
+            GLib.idle_add(self._on_results, results, query, lang, gen)
 
         thread = threading.Thread(target=do_search, daemon=True)
         thread.start()
 
-    def _on_results(self, results, query, lang="sv"):
+    def _on_results(self, results, query, lang="sv", gen=None):
+        if gen is not None and gen != self._search_gen:
+            return
         self.spinner.stop()
         self.spinner.set_visible(False)
         self._results = results
@@ -378,10 +553,20 @@ class ArasaacSearchView(Gtk.Box):
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         box.set_size_request(120, 160)
 
-        image_widget = Gtk.Image.new_from_icon_name(
-            "content-loading-symbolic")
-        image_widget.set_pixel_size(96)
-        box.append(image_widget)
+        # The thumbnail replaces the placeholder by switching stack pages,
+        # so the card itself is never restructured
+        image_stack = Gtk.Stack()
+        placeholder = Gtk.Image.new_from_icon_name("content-loading-symbolic")
+        placeholder.set_pixel_size(96)
+        image_stack.add_named(placeholder, "placeholder")
+        # Shows the pre-scaled thumbnail texture decoded on a worker thread
+        picture = Gtk.Picture()
+        picture.set_size_request(96, 96)
+        picture.set_content_fit(Gtk.ContentFit.CONTAIN)
+        picture.set_can_shrink(True)
+        image_stack.add_named(picture, "picture")
+        image_stack.set_visible_child_name("placeholder")
+        box.append(image_stack)
 
         keyword = get_best_keyword(picto, lang="sv")
         label = Gtk.Label(label=keyword)
@@ -397,39 +582,32 @@ class ArasaacSearchView(Gtk.Box):
         box.append(add_btn)
 
         picto_id = picto["_id"]
+        gen = self._search_gen
 
+        # Finding, downloading and decoding the thumbnail all happen on a
+        # worker thread; the main loop only receives the finished texture
         def load_thumb():
-            path = download_image(picto_id, size=300)
-            if path:
-                GLib.idle_add(self._set_image, image_widget, path)
+            if gen != self._search_gen:
+                return
+            path = get_or_make_thumb(picto_id)
+            if not path or gen != self._search_gen:
+                return
+            try:
+                texture = Gdk.Texture.new_from_filename(path)
+            except GLib.Error:
+                return
+            GLib.idle_add(self._set_image, image_stack, texture)
 
-        thread = threading.Thread(target=load_thumb, daemon=True)
-        thread.start()
+        self._pending.append(_IO_POOL.submit(load_thumb))
 
         return box
 
-    def _set_image(self, image_widget, path):
-        try:
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                path, 96, 96, True)
-            texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-            picture = Gtk.Picture.new_for_paintable(texture)
-            picture.set_size_request(96, 96)
-            picture.set_content_fit(Gtk.ContentFit.CONTAIN)
-            parent = image_widget.get_parent()
-            if parent:
-                next_sibling = image_widget.get_next_sibling()
-                parent.remove(image_widget)
-                if next_sibling:
-                    parent.insert_child_after(
-                        picture,
-                        next_sibling.get_prev_sibling()
-                        if next_sibling.get_prev_sibling() else None)
-                else:
-                    parent.append(picture)
-                parent.reorder_child_after(picture, None)
-        except Exception:
-            pass
+    def _set_image(self, image_stack, texture):
+        if image_stack.get_parent() is None:
+            return False
+        image_stack.get_child_by_name("picture").set_paintable(texture)
+        image_stack.set_visible_child_name("picture")
+        return False
 
     def _on_add_clicked(self, btn, picto):
         btn.set_sensitive(False)
@@ -441,8 +619,7 @@ class ArasaacSearchView(Gtk.Box):
             path = download_image(picto_id)
             GLib.idle_add(self._finish_add, path, picto_id, keyword, btn)
 
-        thread = threading.Thread(target=do_add, daemon=True)
-        thread.start()
+        _IO_POOL.submit(do_add)
 
     def _finish_add(self, path, picto_id, keyword, btn):
         if path:
@@ -457,8 +634,7 @@ class ArasaacSearchView(Gtk.Box):
             }
             existing = self.library.get_by_id(item["id"])
             if not existing:
-                self.library.items.append(item)
-                self.library.save()
+                self.library.add_item(item)
 
             btn.set_label("✓")
             btn.remove_css_class("suggested-action")
@@ -469,6 +645,10 @@ class ArasaacSearchView(Gtk.Box):
             btn.add_css_class("destructive-action")
 
     def _clear_results(self):
+        self._search_gen += 1
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
         while True:
             child = self.flowbox.get_first_child()
             if child is None:
@@ -2,14 +2,12 @@
 
 import csv
 import io
-import json
-import os
 from datetime import datetime
 
 import gettext
 _ = gettext.gettext
 
-from bildstod import __version__
+from bildstod import __version__, json_helper
 
 APP_LABEL = _("Visual Support")
 AUTHOR = "Daniel Nylander"
@@ -23,10 +21,17 @@ from gi.repository import Gtk, Adw, Gio, GLib
 from bildstod.library import get_images_dir
 
 
-def schedule_to_csv(schedule):
-    """Export schedule as CSV string."""
-    output = io.StringIO()
-    writer = csv.writer(output)
+def schedule_to_csv(schedule, fileobj=None):
+    """Export schedule as CSV.
+
+    Rows are written straight to *fileobj* when given, which should be
+    opened with ``newline=""``. Without it the CSV is returned as a string.
+    """
+    if fileobj is None:
+        output = io.StringIO()
+        schedule_to_csv(schedule, output)
+        return output.getvalue()
+    writer = csv.writer(fileobj)
     writer.writerow([_("Time"), _("Activity"), _("Duration (min)"), _("Category"), _("Done")])
     for item in schedule.items:
         writer.writerow([
@@ -38,16 +43,17 @@ def schedule_to_csv(schedule):
         ])
     writer.writerow([])
     writer.writerow([f"{APP_LABEL} v{__version__} — {WEBSITE}"])
-    return output.getvalue()
 
 
-def schedule_to_json(schedule):
-    """Export schedule as JSON string."""
+def schedule_to_json(schedule, fileobj=None):
+    """Export schedule as JSON, written to *fileobj* or returned as a string."""
     data = schedule.to_dict()
     data["_exported_by"] = f"{APP_LABEL} v{__version__}"
     data["_author"] = AUTHOR
     data["_website"] = WEBSITE
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    if fileobj is None:
+        return json_helper.dumps(data, indent=True)
+    json_helper.dump(data, fileobj, indent=True)
 
 
 def export_schedule_pdf(schedule, output_path):
@@ -60,11 +66,6 @@ def export_schedule_pdf(schedule, output_path):
         except ImportError:
             return False
 
-    try:
-        from gi.repository import GdkPixbuf
-    except Exception:
-        pass
-
     width, height = 595, 842  # A4 in points
     surface = cairo.PDFSurface(output_path, width, height)
     ctx = cairo.Context(surface)
@@ -81,11 +82,33 @@ def export_schedule_pdf(schedule, output_path):
     y = 110
     row_height = 80
 
+    # Decorations shared by every row are recorded once and replayed
+    if hasattr(cairo, "Rectangle"):
+        row_extents = cairo.Rectangle(0, 0, width, row_height)
+    else:  # cairocffi takes a plain tuple
+        row_extents = (0, 0, width, row_height)
+    row_template = cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, row_extents)
+    tmpl_ctx = cairo.Context(row_template)
+    # Separator line
+    tmpl_ctx.set_line_width(0.5)
+    tmpl_ctx.set_source_rgb(0.85, 0.85, 0.85)
+    tmpl_ctx.move_to(40, row_height - 5)
+    tmpl_ctx.line_to(width - 40, row_height - 5)
+    tmpl_ctx.stroke()
+    del tmpl_ctx
+
+    # Decoded images keyed by path; schedules often repeat the same picture
+    png_cache = {}
+
     for item in schedule.items:
         if y + row_height > height - 40:
             surface.show_page()
             y = 40
 
+        ctx.set_source_surface(row_template, 0, y)
+        ctx.paint()
+        ctx.set_source_rgb(0, 0, 0)
+
         # Time
         ctx.set_font_size(16)
         ctx.move_to(40, y + 30)
@@ -93,16 +116,21 @@ def export_schedule_pdf(schedule, output_path):
 
         # Try to draw image
         img_path = str(get_images_dir() / item.image_filename) if item.image_filename else ""
-        if img_path and os.path.exists(img_path) and not img_path.endswith(".svg"):
+        if img_path and img_path.endswith(".png"):
+            if img_path not in png_cache:
+                try:
+                    png_cache[img_path] = cairo.ImageSurface.create_from_png(img_path)
+                except Exception:
+                    png_cache[img_path] = None
+            img_surface = png_cache[img_path]
+        else:
+            img_surface = None
+        if img_surface is not None:
             try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(img_path, 60, 60, True)
-                # Convert pixbuf to cairo surface
-                img_surface = cairo.ImageSurface(
-                    cairo.FORMAT_ARGB32, pixbuf.get_width(), pixbuf.get_height()
-                )
-                # Simple pixel copy - for production use GdkPixbuf integration
+                scale = 60 / max(img_surface.get_width(), img_surface.get_height())
                 ctx.save()
                 ctx.translate(100, y)
+                ctx.scale(scale, scale)
                 ctx.set_source_surface(img_surface, 0, 0)
                 ctx.paint()
                 ctx.restore()
@@ -130,16 +158,6 @@ def export_schedule_pdf(schedule, output_path):
             ctx.move_to(500, y + 30)
             ctx.show_text("✓")
 
-        ctx.set_source_rgb(0, 0, 0)
-
-        # Separator line
-        ctx.set_line_width(0.5)
-        ctx.set_source_rgb(0.85, 0.85, 0.85)
-        ctx.move_to(40, y + row_height - 5)
-        ctx.line_to(width - 40, y + row_height - 5)
-        ctx.stroke()
-        ctx.set_source_rgb(0, 0, 0)
-
         y += row_height
 
     # Footer with app name, version, and author
@@ -197,9 +215,8 @@ def _on_text_save_done(dialog, result, schedule, converter, ext, status_callback
     except GLib.Error:
         return
     try:
-        content = converter(schedule)
-        with open(gfile.get_path(), "w") as f:
-            f.write(content)
+        with open(gfile.get_path(), "w", newline="") as f:
+            converter(schedule, f)
         if status_callback:
             now = datetime.now().strftime("%H:%M:%S")
             status_callback(_("Exported %s at %s") % (ext.upper(), now))
@@ -0,0 +1,107 @@
+"""Keep-alive HTTP connections for ARASAAC requests in Bildstöd.
+
+urllib opens a new TCP+TLS connection for every request. A search result
+grid fetches dozens of thumbnails from the same host, so each thread keeps
+one persistent connection per host and reuses it between requests.
+"""
+
+import http.client
+import threading
+from contextlib import contextmanager
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, urlopen
+
+from bildstod import __version__
+
+USER_AGENT = f"Bildstod/{__version__}"
+
+_MAX_REDIRECTS = 5
+
+_local = threading.local()
+
+
+def _get_connection(scheme, netloc, timeout):
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(netloc, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(netloc, timeout=timeout)
+        conns[(scheme, netloc)] = conn
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+
+def _drop_connection(scheme, netloc):
+    conn = getattr(_local, "conns", {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def _send(scheme, netloc, path, headers, timeout):
+    """Send a GET request, retrying once if a kept-alive socket went stale."""
+    for attempt in (1, 2):
+        conn = _get_connection(scheme, netloc, timeout)
+        try:
+            conn.request("GET", path, headers=headers)
+            return conn.getresponse()
+        except (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                ConnectionResetError, BrokenPipeError):
+            _drop_connection(scheme, netloc)
+            if attempt == 2:
+                raise
+        except Exception:
+            _drop_connection(scheme, netloc)
+            raise
+
+
+@contextmanager
+def open_url(url, headers=None, timeout=15):
+    """Open *url* for reading over a pooled connection.
+
+    Works like ``urlopen``: yields the response and raises
+    ``urllib.error.HTTPError`` for non-2xx statuses. Redirects are followed.
+    When a proxy is configured the request falls back to ``urlopen``.
+    """
+    all_headers = {"User-Agent": USER_AGENT}
+    if headers:
+        all_headers.update(headers)
+
+    scheme = urlsplit(url).scheme
+    if scheme in getproxies():
+        with urlopen(Request(url, headers=all_headers), timeout=timeout) as resp:
+            yield resp
+        return
+
+    for _redirect in range(_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        scheme, netloc = parts.scheme, parts.netloc
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        resp = _send(scheme, netloc, path, all_headers, timeout)
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            resp.read()
+            url = urljoin(url, location)
+            continue
+        break
+
+    try:
+        if resp.status >= 300:
+            resp.read()
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        yield resp
+    finally:
+        # A partially read body would desync the next request on this
+        # connection, so throw the connection away instead of reusing it.
+        if not resp.isclosed():
+            _drop_connection(scheme, netloc)
+        resp.close()
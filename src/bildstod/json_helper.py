@@ -0,0 +1,49 @@
+"""JSON parsing and serialization for Bildstöd.
+
+Uses orjson when it is installed, which parses and serializes several
+times faster than the standard library, and falls back to json otherwise.
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+keep catching the standard exception.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent=False):
+    """Serialize *obj* to a JSON string, pretty-printed when *indent* is set.
+
+    Non-ASCII text is written as is in both implementations.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dump(obj, fileobj, indent=False):
+    """Serialize *obj* as JSON to the text file *fileobj*.
+
+    The standard library writes it in chunks as it goes. orjson has no
+    streaming encoder, but it builds the whole text faster than json
+    streams it.
+    """
+    if orjson is not None:
+        fileobj.write(dumps(obj, indent))
+    elif indent:
+        json.dump(obj, fileobj, indent=2, ensure_ascii=False)
+    else:
+        json.dump(obj, fileobj, ensure_ascii=False, separators=(",", ":"))
@@ -1,9 +1,15 @@
 """Picture library management for Bildstöd."""
 
+import functools
+import hashlib
 import json
 import os
 import shutil
+import sys
+import threading
 import uuid
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import gettext
@@ -15,6 +21,11 @@ gi.require_version('Adw', '1')
 gi.require_version('GdkPixbuf', '2.0')
 from gi.repository import Gtk, Adw, Gio, GLib, Gdk, GdkPixbuf
 
+from bildstod import json_helper
+
+# Decodes library thumbnails away from the GTK main thread
+_THUMB_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="library-thumbs")
+
 CATEGORIES = [
     ("morning", _("Morning Routine")),
     ("meals", _("Meals")),
@@ -27,56 +38,378 @@ CATEGORIES = [
     ("other", _("Other")),
 ]
 
+CATEGORY_MAP = dict(CATEGORIES)
+
+
+# The directories below are created on first use and then remembered, so
+# callers in loops don't pay a mkdir for every path they build
+
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir():
     p = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "bildstod"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+@functools.lru_cache(maxsize=1)
 def get_data_dir():
     p = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")) / "bildstod"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+@functools.lru_cache(maxsize=1)
 def get_images_dir():
     p = get_data_dir() / "images"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+@functools.lru_cache(maxsize=1)
+def get_thumbnails_dir():
+    p = get_data_dir() / "thumbnails"
+    p.mkdir(parents=True, exist_ok=True)
+    return p
+
+
+def _fast_copy(src, dst):
+    """Copy file contents only; the imported copy needs no metadata.
+
+    copy_file_range lets the kernel copy (or reflink) the data without
+    passing it through user space. Other systems use shutil.copyfile.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining <= 0:
+                    return
+        except OSError:
+            pass  # e.g. unsupported by the file system
+    shutil.copyfile(src, dst)
+
+
+def _thumb_path(uid, size=96):
+    return get_thumbnails_dir() / f"{uid}_{size}.png"
+
+
+def make_thumbnail(src, uid, size=96):
+    """Scale *src* down to a size×size PNG thumbnail and return its pixbuf."""
+    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(str(src), size, size, True)
+    thumb = _thumb_path(uid, size)
+    tmp = thumb.with_suffix(".part")
+    try:
+        pixbuf.savev(str(tmp), "png", [], [])
+        os.replace(tmp, thumb)
+    except (GLib.Error, OSError):
+        pass
+    return pixbuf
+
+
+def load_thumbnail(uid, img_path, size=96):
+    """Return a pixbuf thumbnail for the library item *uid*.
+
+    Thumbnails are written once and reused, so showing the grid does not
+    decode and scale every full-size image again.
+    """
+    thumb = _thumb_path(uid, size)
+    if thumb.exists():
+        try:
+            return GdkPixbuf.Pixbuf.new_from_file(str(thumb))
+        except GLib.Error:
+            pass
+    return make_thumbnail(img_path, uid, size)
+
+
+# Decoded thumbnail textures, least recently used first:
+# {(uid, img_path, size): Gdk.Texture}
+_TEXTURES = OrderedDict()
+_TEXTURES_MAX = 256
+_TEXTURES_LOCK = threading.Lock()
+
+
+def _thumbnail_texture(uid, img_path, size=96):
+    """Decoded thumbnail texture, kept for the session.
+
+    Textures are immutable and can be shared between widgets, so cards
+    rebuilt by a filter change or scrolled back into view reuse them.
+    Images only change through PictureLibrary, which calls
+    forget_thumbnail(), so a cache hit needs no stat of the file.
+    """
+    key = (uid, img_path, size)
+    with _TEXTURES_LOCK:
+        texture = _TEXTURES.get(key)
+        if texture is not None:
+            _TEXTURES.move_to_end(key)
+            return texture
+    texture = Gdk.Texture.new_for_pixbuf(load_thumbnail(uid, img_path, size))
+    with _TEXTURES_LOCK:
+        _TEXTURES[key] = texture
+        if len(_TEXTURES) > _TEXTURES_MAX:
+            _TEXTURES.popitem(last=False)
+    return texture
+
+
+def forget_thumbnail(uid):
+    """Drop the cached thumbnail of a library item, on disk and in memory."""
+    for thumb in get_thumbnails_dir().glob(f"{uid}_*.png"):
+        thumb.unlink(missing_ok=True)
+    with _TEXTURES_LOCK:
+        for key in [key for key in _TEXTURES if key[0] == uid]:
+            del _TEXTURES[key]
+
+
+# Item fields whose values repeat across the library
+_SHARED_VALUES = ("category", "source")
+
+
+def _compact_record(record):
+    """Make a parsed item share its repeated strings with other items.
+
+    Every parsed line gets its own copies of the keys and of values like
+    the category, so large libraries hold thousands of equal strings.
+    """
+    compact = {}
+    for key, value in record.items():
+        if key in _SHARED_VALUES and isinstance(value, str):
+            value = sys.intern(value)
+        compact[sys.intern(key)] = value
+    return compact
+
+
+# Share of dead lines in library.jsonl that triggers a compacting rewrite
+COMPACT_RATIO = 0.2
+
+_IO_BUFFER = 64 * 1024
+
+
 class PictureLibrary:
-    """Manages the picture library stored in library.json."""
+    """Manages the picture library stored in library.jsonl.
+
+    The file holds one JSON record per line. Adding an item appends a line
+    and removing one appends a tombstone ({"id": ..., "deleted": true}), so
+    single changes never rewrite the whole file. save() writes a compacted
+    copy of the current items.
+    """
 
-    def __init__(self):
+    def __init__(self, load=True):
         self.items = []
-        self.path = get_config_dir() / "library.json"
-        self.load()
+        self._by_id = {}
+        self._by_cat = defaultdict(list)
+        self._drag_payloads = {}  # item id -> GLib.Bytes
+        self.path = get_config_dir() / "library.jsonl"
+        self.legacy_path = get_config_dir() / "library.json"
+        self._dead_lines = 0
+        # Digest of library.jsonl when it holds exactly self.items, or None
+        self._saved_digest = None
+        self._ready_callbacks = []
+        if load:
+            self.load()
 
     def load(self):
-        if self.path.exists():
+        if not self.path.exists():
+            self._load_legacy()
+            return
+        try:
+            with open(self.path, "rb", buffering=_IO_BUFFER) as f:
+                data = f.read()
+        except IOError:
+            data = b""
+        self._load_data(data)
+
+    def load_async(self):
+        """Load the library without blocking the main loop.
+
+        Functions registered with connect_ready() are called once the items
+        are available.
+        """
+        gfile = Gio.File.new_for_path(str(self.path))
+        gfile.load_contents_async(None, self._on_contents_loaded)
+
+    def connect_ready(self, callback):
+        """Call *callback* whenever load_async() has finished."""
+        self._ready_callbacks.append(callback)
+
+    def _on_contents_loaded(self, gfile, result):
+        # Items added while the file was being read must not get lost
+        added_early = self.items
+        try:
+            ok, data, _etag = gfile.load_contents_finish(result)
+        except GLib.Error:
+            data = None
+        if data is None and not self.path.exists():
+            self._load_legacy()
+        else:
+            self._load_data(data or b"")
+        for item in added_early:
+            if item["id"] not in self._by_id:
+                self._track(item)
+        for callback in self._ready_callbacks:
+            callback()
+
+    def _load_data(self, data):
+        """Replay the records of library.jsonl given as bytes."""
+        by_id = {}
+        lines = 0
+        damaged = False
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            lines += 1
             try:
-                with open(self.path) as f:
-                    self.items = json.load(f)
+                record = json_helper.loads(line)
+            except json.JSONDecodeError:
+                # e.g. a line cut short by a crash
+                damaged = True
+                continue
+            if not isinstance(record, dict):
+                damaged = True
+                continue
+            if record.get("deleted"):
+                by_id.pop(record.get("id"), None)
+            else:
+                by_id[record.get("id")] = _compact_record(record)
+        self.items = list(by_id.values())
+        self._dead_lines = lines - len(self.items)
+        unterminated = bool(data) and not data.endswith(b"\n")
+        if damaged or unterminated:
+            self._saved_digest = None
+        else:
+            self._saved_digest = hashlib.blake2b(data, digest_size=16).digest()
+        self._reindex()
+        if damaged or unterminated:
+            # Later appends must not land on the end of a broken or
+            # unterminated line
+            self.save()
+
+    def _load_legacy(self):
+        """Import library.json from older versions, if there is one."""
+        self.items = []
+        self._dead_lines = 0
+        self._saved_digest = None
+        if self.legacy_path.exists():
+            try:
+                self.items = json_helper.loads(self.legacy_path.read_bytes())
             except (json.JSONDecodeError, IOError):
                 self.items = []
-        else:
-            self.items = []
+            else:
+                self.save()
+        self._reindex()
+
+    def _reindex(self):
+        """Rebuild the id and category lookups from self.items."""
+        self._drag_payloads.clear()
+        self._by_id = {}
+        self._by_cat = defaultdict(list)
+        for item in self.items:
+            self._by_id[item["id"]] = item
+            self._by_cat[item.get("category", "other")].append(item)
 
     def save(self):
-        with open(self.path, "w") as f:
-            json.dump(self.items, f, indent=2, ensure_ascii=False)
+        """Rewrite library.jsonl with only the current items.
+
+        The new file is written next to the old one and renamed over it, so
+        a crash mid-write leaves the previous library intact.
+        """
+        data = "".join(json_helper.dumps(item) + "\n" for item in self.items)
+        data = data.encode("utf-8")
+        saved_digest = hashlib.blake2b(data, digest_size=16).digest()
+        if saved_digest == self._saved_digest:
+            return  # the file already holds exactly this
+        tmp = self.path.with_suffix(".jsonl.tmp")
+        with open(tmp, "wb", buffering=_IO_BUFFER) as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+        self._dead_lines = 0
+        self._saved_digest = saved_digest
+
+    def _append(self, *records):
+        self._saved_digest = None
+        data = "".join(json_helper.dumps(record) + "\n" for record in records)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(data)
+
+    def add_item(self, item):
+        """Add an item dict to the library, appending it to the file."""
+        self._track(item)
+        self._append(item)
+
+    def _track(self, item):
+        self.items.append(item)
+        self._by_id[item["id"]] = item
+        self._by_cat[item.get("category", "other")].append(item)
 
     def add_image(self, source_path, label, category="other", duration=0):
         """Import an image into the library. Returns the new item dict."""
+        item = self._import_image(source_path, label, category, duration)
+        if item is not None:
+            self.add_item(item)
+        return item
+
+    def add_images(self, specs, on_done=None):
+        """Import several images in the background.
+
+        *specs* holds (source_path, label, category, duration) tuples. The
+        files are copied in parallel off the main loop; once all are done
+        the items are added, the library file is written once, and
+        *on_done* is called on the main loop with the new item dicts.
+        Files that can't be imported are skipped.
+        """
+        specs = list(specs)
+        imported = [None] * len(specs)
+        pending = len(specs)
+
+        def finish():
+            items = [item for item in imported if item is not None]
+            for item in items:
+                self._track(item)
+            if items:
+                self._append(*items)
+            if on_done:
+                on_done(items)
+            return False
+
+        def collect(index, future):
+            nonlocal pending
+            if future.exception() is None:
+                imported[index] = future.result()
+            pending -= 1
+            if pending == 0:
+                finish()
+            return False
+
+        if not specs:
+            GLib.idle_add(finish)
+            return
+        for index, spec in enumerate(specs):
+            future = _THUMB_POOL.submit(self._import_image, *spec)
+            future.add_done_callback(
+                lambda f, index=index: GLib.idle_add(collect, index, f))
+
+    def _import_image(self, source_path, label, category="other", duration=0):
+        """Copy an image into the images directory and build its item."""
         src = Path(source_path)
         ext = src.suffix.lower()
         if ext not in (".png", ".jpg", ".jpeg", ".svg"):
             return None
         uid = str(uuid.uuid4())
         dest = get_images_dir() / f"{uid}{ext}"
-        shutil.copy2(src, dest)
+        try:
+            _fast_copy(src, dest)
+        except OSError:
+            # e.g. unreadable source or a full disk; leave no partial copy
+            dest.unlink(missing_ok=True)
+            return None
+        try:
+            make_thumbnail(dest, uid)
+        except GLib.Error:
+            pass
         item = {
             "id": uid,
             "filename": dest.name,
@@ -84,8 +417,6 @@ class PictureLibrary:
             "category": category,
             "duration": duration,
         }
-        self.items.append(item)
-        self.save()
         return item
 
     def remove_image(self, item_id):
@@ -94,17 +425,62 @@ class PictureLibrary:
             img_path = get_images_dir() / item["filename"]
             if img_path.exists():
                 img_path.unlink()
-            self.items = [i for i in self.items if i["id"] != item_id]
+            forget_thumbnail(item_id)
+            self._drag_payloads.pop(item_id, None)
+            if item.get("source") == "arasaac":
+                from bildstod.arasaac import forget_known_files
+                forget_known_files()
+            self.items.remove(item)
+            del self._by_id[item_id]
+            self._by_cat[item.get("category", "other")].remove(item)
+            self._append({"id": item_id, "deleted": True})
+            # The removed item and its tombstone are both dead lines now
+            self._dead_lines += 2
+            self._maybe_compact()
+
+    def update_item(self, item_id, **fields):
+        """Change fields of an item. Returns the item, or None if unknown.
+
+        The new record is appended to the file. Cached renders of the item
+        are dropped, including its thumbnail when the image changed.
+        """
+        item = self.get_by_id(item_id)
+        if item is None:
+            return None
+        old_category = item.get("category", "other")
+        old_filename = item.get("filename")
+        item.update(fields)
+        new_category = item.get("category", "other")
+        if new_category != old_category:
+            self._by_cat[old_category].remove(item)
+            self._by_cat[new_category].append(item)
+        if item.get("filename") != old_filename:
+            forget_thumbnail(item_id)
+        self._drag_payloads.pop(item_id, None)
+        self._append(item)
+        self._dead_lines += 1  # the previous record of the item
+        self._maybe_compact()
+        return item
+
+    def _maybe_compact(self):
+        total = len(self.items) + self._dead_lines
+        if self._dead_lines > COMPACT_RATIO * total:
             self.save()
 
+    def get_drag_payload(self, item):
+        """Serialized item for drag and drop, as GLib.Bytes."""
+        payload = self._drag_payloads.get(item["id"])
+        if payload is None:
+            payload = GLib.Bytes.new(json_helper.dumps(item).encode())
+            self._drag_payloads[item["id"]] = payload
+        return payload
+
     def get_by_id(self, item_id):
-        for i in self.items:
-            if i["id"] == item_id:
-                return i
-        return None
+        return self._by_id.get(item_id)
 
     def get_by_category(self, category):
-        return [i for i in self.items if i["category"] == category]
+        """Items in *category*. The returned list is shared; do not modify it."""
+        return self._by_cat.get(category, ())
 
     def get_image_path(self, item):
         return str(get_images_dir() / item["filename"])
@@ -118,6 +494,9 @@ class LibraryView(Gtk.Box):
         self.library = library
         self.status_callback = status_callback
         self._on_item_activated = None
+        self._visible_tick = 0
+        self._populate_src = 0
+        self._file_dialog = None
 
         # Toolbar
         toolbar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -165,6 +544,13 @@ class LibraryView(Gtk.Box):
         self.flowbox.connect("child-activated", self._on_child_activated)
         scroll.set_child(self.flowbox)
         self.append(scroll)
+        self.scroll = scroll
+        library.connect_ready(self._populate)
+
+        # Thumbnails are only decoded for cards in or near the viewport
+        vadj = scroll.get_vadjustment()
+        vadj.connect("value-changed", self._schedule_visible_load)
+        vadj.connect("changed", self._schedule_visible_load)
 
         # Drag source setup on the flowbox children happens in _populate
         self._populate()
@@ -178,12 +564,6 @@ class LibraryView(Gtk.Box):
             self._on_item_activated(child._item)
 
     def _populate(self):
-        while True:
-            child = self.flowbox.get_first_child()
-            if child is None:
-                break
-            self.flowbox.remove(child)
-
         selected_cat = self.category_dropdown.get_selected()
         if selected_cat == 0:
             items = self.library.items
@@ -191,32 +571,55 @@ class LibraryView(Gtk.Box):
             cat_key = CATEGORIES[selected_cat - 1][0]
             items = self.library.get_by_category(cat_key)
 
-        for item in items:
-            card = self._make_card(item)
-            self.flowbox.append(card)
+        # Only cards whose item left the view are removed and only new items
+        # get a card. A reloaded library has new item dicts, so identity
+        # rather than id decides whether a card is still current.
+        wanted = {id(item) for item in items}
+        existing = {}
+        child = self.flowbox.get_first_child()
+        while child is not None:
+            next_child = child.get_next_sibling()
+            card = child.get_child()
+            if id(card._item) in wanted:
+                existing[id(card._item)] = card
+            else:
+                future = card._thumb_future
+                if future is not None:
+                    future.cancel()
+                self.flowbox.remove(child)
+            child = next_child
+
+        if len(existing) < len(items):
+            # Kept cards are already in library order, so inserting each
+            # new card at its index keeps the grid ordered
+            for position, item in enumerate(items):
+                if id(item) not in existing:
+                    self.flowbox.insert(self._make_card(item), position)
+        self._schedule_visible_load()
 
     def _make_card(self, item):
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         box.set_size_request(120, 140)
         box._item = item
 
-        img_path = self.library.get_image_path(item)
-        if os.path.exists(img_path):
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(img_path, 96, 96, True)
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                picture = Gtk.Picture.new_for_paintable(texture)
-                picture.set_size_request(96, 96)
-                picture.set_content_fit(Gtk.ContentFit.CONTAIN)
-                box.append(picture)
-            except Exception:
-                icon = Gtk.Image.new_from_icon_name("image-missing-symbolic")
-                icon.set_pixel_size(64)
-                box.append(icon)
-        else:
-            icon = Gtk.Image.new_from_icon_name("image-missing-symbolic")
-            icon.set_pixel_size(64)
-            box.append(icon)
+        # Placeholder until the thumbnail is decoded on a worker thread
+        image_stack = Gtk.Stack()
+        loading = Gtk.Image.new_from_icon_name("image-loading-symbolic")
+        loading.set_pixel_size(64)
+        image_stack.add_named(loading, "loading")
+        missing = Gtk.Image.new_from_icon_name("image-missing-symbolic")
+        missing.set_pixel_size(64)
+        image_stack.add_named(missing, "missing")
+        picture = Gtk.Picture()
+        picture.set_size_request(96, 96)
+        picture.set_content_fit(Gtk.ContentFit.CONTAIN)
+        image_stack.add_named(picture, "picture")
+        box.append(image_stack)
+
+        image_stack.set_visible_child_name("loading")
+        box._image_stack = image_stack
+        box._thumb_state = None  # None, "queued", "loaded" or "missing"
+        box._thumb_future = None
 
         label = Gtk.Label(label=item.get("label", ""))
         label.set_ellipsize(3)  # PANGO_ELLIPSIZE_END
@@ -237,40 +640,139 @@ class LibraryView(Gtk.Box):
 
         return box
 
+    def _schedule_visible_load(self, *args):
+        # Positions are only known after layout, so check on the next frame
+        if not self._visible_tick:
+            self._visible_tick = self.flowbox.add_tick_callback(self._on_visible_tick)
+
+    def _on_visible_tick(self, widget, frame_clock):
+        first = self.flowbox.get_first_child()
+        if first is not None and first.get_height() == 0:
+            return GLib.SOURCE_CONTINUE  # not laid out yet
+        self._visible_tick = 0
+        self._load_visible()
+        return GLib.SOURCE_REMOVE
+
+    def _load_visible(self):
+        """Decode thumbnails near the viewport and drop far away ones."""
+        vadj = self.scroll.get_vadjustment()
+        top = vadj.get_value()
+        page = vadj.get_page_size()
+        # Load a page ahead in both directions, keep a few more pages
+        load_top, load_bottom = top - page, top + 2 * page
+        keep_top, keep_bottom = top - 3 * page, top + 4 * page
+
+        child = self.flowbox.get_first_child()
+        while child is not None:
+            card = child.get_child()
+            ok, bounds = child.compute_bounds(self.flowbox)
+            if ok and hasattr(card, "_thumb_state"):
+                y0 = bounds.get_y()
+                y1 = y0 + bounds.get_height()
+                if y1 >= load_top and y0 <= load_bottom:
+                    self._load_card_thumb(card)
+                elif y1 < keep_top or y0 > keep_bottom:
+                    self._evict_card_thumb(card)
+            child = child.get_next_sibling()
+
+    def _load_card_thumb(self, card):
+        if card._thumb_state is not None:
+            return
+        card._thumb_state = "queued"
+        item = card._item
+        img_path = self.library.get_image_path(item)
+
+        def decode():
+            try:
+                # A missing image fails to decode and shows the fallback icon
+                texture = _thumbnail_texture(item["id"], img_path)
+            except Exception:
+                texture = None
+            GLib.idle_add(self._apply_texture, card, texture)
+
+        card._thumb_future = _THUMB_POOL.submit(decode)
+
+    def _evict_card_thumb(self, card):
+        if card._thumb_state != "loaded":
+            return
+        card._image_stack.get_child_by_name("picture").set_paintable(None)
+        card._image_stack.set_visible_child_name("loading")
+        card._thumb_state = None
+
+    def _apply_texture(self, card, texture):
+        card._thumb_future = None
+        if card.get_parent() is None:
+            return False  # removed while decoding
+        image_stack = card._image_stack
+        if texture is None:
+            image_stack.set_visible_child_name("missing")
+            card._thumb_state = "missing"
+        else:
+            image_stack.get_child_by_name("picture").set_paintable(texture)
+            image_stack.set_visible_child_name("picture")
+            card._thumb_state = "loaded"
+        return False
+
     def _on_drag_prepare(self, source, x, y, item):
-        val = GLib.Bytes.new(json.dumps(item).encode())
+        val = self.library.get_drag_payload(item)
         return Gdk.ContentProvider.new_for_bytes("application/x-bildstod-item", val)
 
     def _category_name(self, key):
-        for k, v in CATEGORIES:
-            if k == key:
-                return v
-        return _("Other")
+        return CATEGORY_MAP.get(key, CATEGORY_MAP["other"])
 
     def _on_filter_changed(self, dropdown, pspec):
+        # Stepping through the dropdown with the keyboard changes the filter
+        # once per key press; rebuild the grid once it settles
+        if self._populate_src:
+            GLib.source_remove(self._populate_src)
+        self._populate_src = GLib.timeout_add(50, self._populate_and_clear)
+
+    def _populate_and_clear(self):
+        self._populate_src = 0
         self._populate()
+        return False
 
     def _on_add_clicked(self, btn):
-        dialog = Gtk.FileDialog.new()
-        dialog.set_title(_("Import Image"))
-        ff = Gtk.FileFilter()
-        ff.set_name(_("Images"))
-        ff.add_mime_type("image/png")
-        ff.add_mime_type("image/jpeg")
-        ff.add_mime_type("image/svg+xml")
-        filters = Gio.ListStore.new(Gtk.FileFilter)
-        filters.append(ff)
-        dialog.set_filters(filters)
-        dialog.open(self.get_root(), None, self._on_file_chosen)
+        if self._file_dialog is None:
+            dialog = Gtk.FileDialog.new()
+            dialog.set_title(_("Import Image"))
+            ff = Gtk.FileFilter()
+            ff.set_name(_("Images"))
+            ff.add_mime_type("image/png")
+            ff.add_mime_type("image/jpeg")
+            ff.add_mime_type("image/svg+xml")
+            filters = Gio.ListStore.new(Gtk.FileFilter)
+            filters.append(ff)
+            dialog.set_filters(filters)
+            self._file_dialog = dialog
+        self._file_dialog.open_multiple(self.get_root(), None, self._on_file_chosen)
 
     def _on_file_chosen(self, dialog, result):
         try:
-            gfile = dialog.open_finish(result)
+            files = dialog.open_multiple_finish(result)
         except GLib.Error:
             return
-        filepath = gfile.get_path()
-        # Show a simple dialog to get label and category
-        self._show_add_dialog(filepath)
+        filepaths = [files.get_item(i).get_path() for i in range(files.get_n_items())]
+        if len(filepaths) == 1:
+            # Show a simple dialog to get label and category
+            self._show_add_dialog(filepaths[0])
+        elif filepaths:
+            # Several files are imported at once, labelled by file name
+            cat = self._selected_category()
+            specs = [(path, Path(path).stem, cat, 0) for path in filepaths]
+            self.library.add_images(specs, self._on_images_imported)
+
+    def _on_images_imported(self, items):
+        self._populate()
+        if self.status_callback:
+            self.status_callback(_("Images imported: %d") % len(items))
+
+    def _selected_category(self):
+        """Category key for new images: the filtered one, else "other"."""
+        sel = self.category_dropdown.get_selected()
+        if sel > 0:
+            return CATEGORIES[sel - 1][0]
+        return "other"
 
     def _show_add_dialog(self, filepath):
         dialog = Adw.AlertDialog.new(_("Add to Library"), _("Enter a label for this image:"))
@@ -296,11 +798,7 @@ class LibraryView(Gtk.Box):
             label = entry.get_text().strip()
             if not label:
                 label = Path(filepath).stem
-            # Use first category as default
-            cat = "other"
-            sel = self.category_dropdown.get_selected()
-            if sel > 0:
-                cat = CATEGORIES[sel - 1][0]
+            cat = self._selected_category()
             self.library.add_image(filepath, label, cat)
             self._populate()
             if self.status_callback:
@@ -320,5 +818,7 @@ class LibraryView(Gtk.Box):
                 self.status_callback(_("Image removed: %s") % item.get("label", ""))
 
     def refresh(self):
+        from bildstod.arasaac import forget_known_files
+        forget_known_files()
         self.library.load()
         self._populate()
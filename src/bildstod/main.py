@@ -2,16 +2,18 @@
 """Bildstöd — Visual schedule and picture support tool for children with autism."""
 
 import json
+import os
+import shutil
 import sys
 import gettext
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, Gio, GLib
+from gi.repository import Gtk, Adw, Gio, GLib, GObject
 
 # Set up gettext
 TEXTDOMAIN = 'bildstod'
@@ -19,19 +21,123 @@ gettext.textdomain(TEXTDOMAIN)
 gettext.bindtextdomain(TEXTDOMAIN, '/usr/share/locale')
 _ = gettext.gettext
 
-from bildstod import __version__
+from bildstod import __version__, json_helper
 from bildstod.library import PictureLibrary, LibraryView
 from bildstod.arasaac import ArasaacSearchView
-from bildstod.schedule import ScheduleView
+from bildstod.schedule import ScheduleView, ScheduleItem
 from bildstod.now_view import NowView
 from bildstod.templates import (
     get_builtin_templates, list_user_templates,
-    template_to_schedule, save_as_template,
+    template_to_schedule, write_template,
     prefetch_template_images,
 )
 from bildstod.export import show_export_dialog
 from bildstod.accessibility import apply_large_text
 from bildstod.accessibility import AccessibilityManager
+from bildstod.tts import get_tts_info
+
+# Status and row strings used on every event; the catalog does not
+# change at runtime, so look them up once
+_READY = _("Ready")
+_REFRESHING = _("Refreshing...")
+_COMPLETED_FMT = _("Completed: %s")
+_ADDED_FMT = _("Added to schedule: %s")
+_TEMPLATE_LOADED_FMT = _("Template loaded: %s")
+_TEMPLATE_SAVED_FMT = _("Template saved: %s")
+_SAVE_ERROR_FMT = _("Error saving: %s")
+_ACTIVITIES_FMT = _("%d activities")
+_CUSTOM_ACTIVITIES_FMT = _("%d activities (custom)")
+_CUSTOM = _("Custom")
+
+# Toolkit and interpreter versions don't change while the app runs
+_DEBUG_INFO_STATIC = (
+    f"Version: {__version__}\n"
+    f"GTK: {Gtk.get_major_version()}.{Gtk.get_minor_version()}\n"
+    f"Adwaita: {Adw.get_major_version()}.{Adw.get_minor_version()}\n"
+    f"Python: {sys.version}"
+)
+
+# Primary menu model; menu models are immutable here, so every window
+# can share the one instance
+_MAIN_MENU = Gio.Menu()
+_MAIN_MENU.append(_("Templates"), "win.templates")
+_MAIN_MENU.append(_("Export Schedule"), "app.export")
+_MAIN_MENU.append(_("Preferences"), "app.preferences")
+_MAIN_MENU.append(_("Keyboard Shortcuts"), "app.shortcuts")
+_MAIN_MENU.append(_("About Visual Support"), "app.about")
+
+_SHORTCUTS_XML = '''
+<interface>
+  <object class="GtkShortcutsWindow" id="shortcuts">
+    <property name="modal">True</property>
+    <child>
+      <object class="GtkShortcutsSection">
+        <property name="section-name">shortcuts</property>
+        <child>
+          <object class="GtkShortcutsGroup">
+            <property name="title" translatable="yes">General</property>
+            <child>
+              <object class="GtkShortcutsShortcut">
+                <property name="title" translatable="yes">Preferences</property>
+                <property name="accelerator">&lt;Primary&gt;comma</property>
+              </object>
+            </child>
+            <child>
+              <object class="GtkShortcutsShortcut">
+                <property name="title" translatable="yes">Export Schedule</property>
+                <property name="accelerator">&lt;Primary&gt;e</property>
+              </object>
+            </child>
+            <child>
+              <object class="GtkShortcutsShortcut">
+                <property name="title" translatable="yes">Refresh</property>
+                <property name="accelerator">F5</property>
+              </object>
+            </child>
+            <child>
+              <object class="GtkShortcutsShortcut">
+                <property name="title" translatable="yes">Keyboard Shortcuts</property>
+                <property name="accelerator">&lt;Primary&gt;slash</property>
+              </object>
+            </child>
+            <child>
+              <object class="GtkShortcutsShortcut">
+                <property name="title" translatable="yes">About</property>
+                <property name="accelerator">F1</property>
+              </object>
+            </child>
+            <child>
+              <object class="GtkShortcutsShortcut">
+                <property name="title" translatable="yes">Quit</property>
+                <property name="accelerator">&lt;Primary&gt;q</property>
+              </object>
+            </child>
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+'''
+
+
+class _TemplateEntry(GObject.Object):
+    """List model item for the template dialog.
+
+    The row texts are worked out once here, so binding a recycled row
+    only has to set them.
+    """
+
+    def __init__(self, template, is_builtin):
+        super().__init__()
+        self.template = template
+        if is_builtin:
+            self.title = template["name"]
+            self.subtitle = _ACTIVITIES_FMT % len(template["items"])
+        else:
+            self.title = template.get("name", _CUSTOM)
+            self.subtitle = _CUSTOM_ACTIVITIES_FMT % len(template.get("items", []))
+
 
 class MainWindow(Adw.ApplicationWindow):
     def __init__(self, *args, **kwargs):
@@ -42,21 +148,25 @@ class MainWindow(Adw.ApplicationWindow):
         # Easter egg state
         self._egg_clicks = 0
         self._egg_timer = None
+        self._shortcuts_window = None
+        self._template_factory = None
+        self._pending_status = None
+        self._status_idle_id = 0
+        self._refresh_pending = False
+        self._notify_pending = False
 
         
 
         # Initialize data
-        self.library = PictureLibrary()
+        # Read in the background; the views fill in once it is loaded
+        self.library = PictureLibrary(load=False)
         
         # Initialize offline cache and connectivity monitoring
         self._init_offline_support()
 
-        # Pre-download ARASAAC images used by built-in templates
-        prefetch_template_images()
-
         # Main layout
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        self.set_content(main_box)
+        toolbar_view = Adw.ToolbarView()
+        self.set_content(toolbar_view)
 
         # Header bar
         header = Adw.HeaderBar()
@@ -89,16 +199,10 @@ class MainWindow(Adw.ApplicationWindow):
         # Menu button
         menu_btn = Gtk.MenuButton()
         menu_btn.set_icon_name("open-menu-symbolic")
-        menu = Gio.Menu()
-        menu.append(_("Templates"), "win.templates")
-        menu.append(_("Export Schedule"), "app.export")
-        menu.append(_("Preferences"), "app.preferences")
-        menu.append(_("Keyboard Shortcuts"), "app.shortcuts")
-        menu.append(_("About Visual Support"), "app.about")
-        menu_btn.set_menu_model(menu)
+        menu_btn.set_menu_model(_MAIN_MENU)
         header.pack_end(menu_btn)
 
-        main_box.append(header)
+        toolbar_view.add_top_bar(header)
 
         # Create views
         self.schedule_view = ScheduleView(self.library, status_callback=self._set_status)
@@ -112,6 +216,7 @@ class MainWindow(Adw.ApplicationWindow):
         self.library_view.set_on_item_activated(self._on_library_item_activated)
 
         self.arasaac_view = ArasaacSearchView(self.library, status_callback=self._set_status)
+        self.library.load_async()
 
         # Add views to stack — Library first for better first-impression
         self.view_stack.add_titled_with_icon(
@@ -127,7 +232,7 @@ class MainWindow(Adw.ApplicationWindow):
             self.arasaac_view, "arasaac", _("ARASAAC"), "system-search-symbolic"
         )
 
-        main_box.append(self.view_stack)
+        toolbar_view.set_content(self.view_stack)
 
         # Status bar
         status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -136,7 +241,7 @@ class MainWindow(Adw.ApplicationWindow):
         status_box.set_margin_top(4)
         status_box.set_margin_bottom(4)
 
-        self.status_label = Gtk.Label(label=_("Ready"))
+        self.status_label = Gtk.Label(label=_READY)
         self.status_label.set_halign(Gtk.Align.START)
         self.status_label.set_hexpand(True)
         self.status_label.add_css_class("dim-label")
@@ -148,12 +253,17 @@ class MainWindow(Adw.ApplicationWindow):
         self.clock_label.add_css_class("caption")
         status_box.append(self.clock_label)
 
-        main_box.append(Gtk.Separator())
-        main_box.append(status_box)
+        toolbar_view.add_bottom_bar(status_box)
 
         # Update clock
+        self._last_clock_text = None
         self._update_clock()
-        GLib.timeout_add_seconds(30, self._update_clock)
+        self._schedule_clock_tick()
+
+        # Pre-download ARASAAC images used by built-in templates once the
+        # window is up, refreshing the schedule as they arrive
+        self._template_refresh_src = 0
+        GLib.idle_add(self._start_template_prefetch, priority=GLib.PRIORITY_LOW)
 
         # Window actions
         templates_action = Gio.SimpleAction.new("templates", None)
@@ -161,28 +271,73 @@ class MainWindow(Adw.ApplicationWindow):
         self.add_action(templates_action)
 
     def _set_status(self, text):
-        now = datetime.now().strftime("%H:%M:%S")
-        self.status_label.set_text(f"[{now}] {text}")
+        # Messages often arrive in bursts; only the last one in a main
+        # loop iteration needs to be shown
+        self._pending_status = text
+        if not self._status_idle_id:
+            self._status_idle_id = GLib.idle_add(self._flush_status)
+
+    def _flush_status(self):
+        self._status_idle_id = 0
+        text, self._pending_status = self._pending_status, None
+        now = GLib.DateTime.new_now_local().format("%H:%M:%S")
+        status = f"[{now}] {text}"
+        if status != self.status_label.get_text():
+            self.status_label.set_text(status)
+        return False
 
     def _update_clock(self):
-        self.clock_label.set_text(datetime.now().strftime("%Y-%m-%d %H:%M"))
-        return True
+        # Only touch the label when the minute changed, so unchanged ticks
+        # don't invalidate its layout
+        text = GLib.DateTime.new_now_local().format("%Y-%m-%d %H:%M")
+        if text != self._last_clock_text:
+            self._last_clock_text = text
+            self.clock_label.set_text(text)
+
+    def _schedule_clock_tick(self):
+        # The clock shows minutes, so wake up just after the next minute
+        # starts instead of polling. Re-arming every tick keeps it aligned.
+        now = GLib.DateTime.new_now_local()
+        ms = 60000 - now.get_second() * 1000 - now.get_microsecond() // 1000
+        GLib.timeout_add(ms + 20, self._on_clock_tick)
+
+    def _on_clock_tick(self):
+        self._update_clock()
+        self._schedule_clock_tick()
+        return False
 
     def _on_schedule_changed(self, schedule):
         self.now_view.update_schedule(schedule)
 
     def _on_activity_done(self, item):
-        self.schedule_view.refresh()
-        self._set_status(_("Completed: %s") % item.label)
+        self._queue_refresh()
+        self._set_status(_COMPLETED_FMT % item.label)
 
     def _on_library_item_activated(self, item):
         """When a library item is activated, add it to the schedule."""
-        from bildstod.schedule import ScheduleItem
         sched_item = ScheduleItem.from_library_item(item)
         self.schedule_view.schedule.add_item(sched_item)
+        self._queue_refresh(notify=True)
+        self._set_status(_ADDED_FMT % item["label"])
+
+    def _queue_refresh(self, notify=False):
+        """Rebuild the schedule view once for a burst of changes.
+
+        With *notify*, listeners of the schedule are told about the change
+        as well.
+        """
+        self._notify_pending |= notify
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            GLib.idle_add(self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
         self.schedule_view.refresh()
-        self.schedule_view._notify_change()
-        self._set_status(_("Added to schedule: %s") % item["label"])
+        if self._notify_pending:
+            self._notify_pending = False
+            self.schedule_view._notify_change()
+        return False
 
     def _show_templates(self, action, param):
         dialog = Adw.AlertDialog.new(
@@ -190,32 +345,35 @@ class MainWindow(Adw.ApplicationWindow):
             _("Load a template or save current schedule as template:")
         )
 
-        listbox = Gtk.ListBox()
-        listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        listbox.add_css_class("boxed-list")
-
-        # Built-in templates
-        builtin = get_builtin_templates()
-        for tpl in builtin:
-            row = Adw.ActionRow()
-            row.set_title(tpl["name"])
-            row.set_subtitle(_("%d activities") % len(tpl["items"]))
-            row._template = tpl
-            row._is_builtin = True
-            listbox.append(row)
-
-        # User templates
-        user_templates = list_user_templates()
-        for tpl in user_templates:
-            row = Adw.ActionRow()
-            row.set_title(tpl.get("name", _("Custom")))
-            row.set_subtitle(_("%d activities (custom)") % len(tpl.get("items", [])))
-            row._template = tpl
-            row._is_builtin = False
-            listbox.append(row)
+        # Rows are created for the visible templates only and recycled
+        # while scrolling, however many user templates there are
+        store = Gio.ListStore.new(_TemplateEntry)
+        store.splice(0, 0, [_TemplateEntry(tpl, True)
+                            for tpl in get_builtin_templates()])
+
+        # User templates are JSON files on disk; read them in the
+        # background and add them once parsed
+        def read_user_templates():
+            templates = list_user_templates()
+            GLib.idle_add(self._add_user_templates, store, templates)
+
+        self.get_application().io_executor.submit(read_user_templates)
+
+        selection = Gtk.SingleSelection.new(store)
+        selection.set_autoselect(False)
+        selection.set_can_unselect(True)
+        selection.set_selected(Gtk.INVALID_LIST_POSITION)
+
+        if self._template_factory is None:
+            self._template_factory = Gtk.SignalListItemFactory()
+            self._template_factory.connect("setup", self._on_template_row_setup)
+            self._template_factory.connect("bind", self._on_template_row_bind)
+
+        list_view = Gtk.ListView.new(selection, self._template_factory)
+        list_view.add_css_class("rich-list")
 
         scroll = Gtk.ScrolledWindow()
-        scroll.set_child(listbox)
+        scroll.set_child(list_view)
         scroll.set_size_request(350, 300)
         dialog.set_extra_child(scroll)
 
@@ -226,28 +384,65 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_default_response("load")
         dialog.set_close_response("cancel")
 
-        dialog.connect("response", self._on_template_response, listbox)
+        dialog.connect("response", self._on_template_response, selection)
         dialog.present(self)
 
-    def _on_template_response(self, dialog, response, listbox):
+    def _add_user_templates(self, store, templates):
+        store.splice(store.get_n_items(), 0,
+                     [_TemplateEntry(tpl, False) for tpl in templates])
+        return False
+
+    def _on_template_row_setup(self, factory, list_item):
+        list_item.set_child(Adw.ActionRow())
+
+    def _on_template_row_bind(self, factory, list_item):
+        row = list_item.get_child()
+        entry = list_item.get_item()
+        row.set_title(entry.title)
+        row.set_subtitle(entry.subtitle)
+
+    def _on_template_response(self, dialog, response, selection):
         if response == "load":
-            selected = listbox.get_selected_row()
-            if selected and hasattr(selected, '_template'):
-                schedule = template_to_schedule(selected._template)
+            selected = selection.get_selected_item()
+            if selected is not None:
+                schedule = template_to_schedule(selected.template)
                 self.schedule_view.load_schedule(schedule)
-                self._set_status(_("Template loaded: %s") % schedule.name)
+                self._set_status(_TEMPLATE_LOADED_FMT % schedule.name)
                 # Refresh after a short delay to show images downloaded in background
                 GLib.timeout_add(2000, self._refresh_after_template)
         elif response == "save":
-            schedule = self.schedule_view.schedule
-            path = save_as_template(schedule)
-            self._set_status(_("Template saved: %s") % path.name)
+            # Snapshot on the main thread; the view may edit the schedule
+            # while the file is being written
+            tpl = self.schedule_view.schedule.to_dict()
+
+            def save():
+                try:
+                    path = write_template(tpl)
+                except OSError as e:
+                    GLib.idle_add(self._set_status, _SAVE_ERROR_FMT % str(e))
+                    return
+                GLib.idle_add(self._set_status, _TEMPLATE_SAVED_FMT % path.name)
+
+            self.get_application().io_executor.submit(save)
 
     def _refresh_after_template(self):
         """Refresh schedule view after template images have downloaded."""
+        self._template_refresh_src = 0
         self.schedule_view.refresh()
         return False  # Don't repeat
 
+    def _start_template_prefetch(self):
+        prefetch_template_images(
+            lambda picto_id: GLib.idle_add(self._on_template_image_ready))
+        return False
+
+    def _on_template_image_ready(self):
+        # Images often land in quick succession; refresh once for a burst
+        if not self._template_refresh_src:
+            self._template_refresh_src = GLib.timeout_add(
+                500, self._refresh_after_template)
+        return False
+
     def show_about(self, action, param):
         about = Adw.AboutDialog(
             application_name=_("Visual Support"),
@@ -269,10 +464,7 @@ class MainWindow(Adw.ApplicationWindow):
                 "Part of the Autismappar suite — free tools for "
                 "communication and daily structure."
             ),
-            debug_info=f"TTS: {__import__('bildstod.tts', fromlist=['get_tts_info']).get_tts_info()}\nVersion: {__version__}\n"
-                       f"GTK: {Gtk.get_major_version()}.{Gtk.get_minor_version()}\n"
-                       f"Adwaita: {Adw.get_major_version()}.{Adw.get_minor_version()}\n"
-                       f"Python: {sys.version}",
+            debug_info=f"TTS: {get_tts_info()}\n{_DEBUG_INFO_STATIC}",
             debug_info_filename="bildstod-debug-info.txt",
         )
         about.add_link(_("Autismappar"), "https://www.autismappar.se")
@@ -287,63 +479,13 @@ class MainWindow(Adw.ApplicationWindow):
         about.present(self)
 
     def show_shortcuts(self, action, param):
-        builder = Gtk.Builder()
-        builder.add_from_string('''
-        <interface>
-          <object class="GtkShortcutsWindow" id="shortcuts">
-            <property name="modal">True</property>
-            <child>
-              <object class="GtkShortcutsSection">
-                <property name="section-name">shortcuts</property>
-                <child>
-                  <object class="GtkShortcutsGroup">
-                    <property name="title" translatable="yes">General</property>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">Preferences</property>
-                        <property name="accelerator">&lt;Primary&gt;comma</property>
-                      </object>
-                    </child>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">Export Schedule</property>
-                        <property name="accelerator">&lt;Primary&gt;e</property>
-                      </object>
-                    </child>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">Refresh</property>
-                        <property name="accelerator">F5</property>
-                      </object>
-                    </child>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">Keyboard Shortcuts</property>
-                        <property name="accelerator">&lt;Primary&gt;slash</property>
-                      </object>
-                    </child>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">About</property>
-                        <property name="accelerator">F1</property>
-                      </object>
-                    </child>
-                    <child>
-                      <object class="GtkShortcutsShortcut">
-                        <property name="title" translatable="yes">Quit</property>
-                        <property name="accelerator">&lt;Primary&gt;q</property>
-                      </object>
-                    </child>
-                  </object>
-                </child>
-              </object>
-            </child>
-          </object>
-        </interface>
-        ''')
-        shortcuts = builder.get_object("shortcuts")
-        shortcuts.set_transient_for(self)
-        shortcuts.present()
+        # Build the window once and keep it around for later opens
+        if self._shortcuts_window is None:
+            builder = Gtk.Builder.new_from_string(_SHORTCUTS_XML, -1)
+            self._shortcuts_window = builder.get_object("shortcuts")
+            self._shortcuts_window.set_hide_on_close(True)
+            self._shortcuts_window.set_transient_for(self)
+        self._shortcuts_window.present()
 
     def _on_icon_clicked(self, *args):
         """Handle clicks on app icon for easter egg."""
@@ -466,27 +608,55 @@ class MainWindow(Adw.ApplicationWindow):
 
 
 CONFIG_DIR = Path(GLib.get_user_config_dir()) / "bildstod"
+ARASAAC_CACHE_DIR = Path(GLib.get_user_cache_dir()) / "arasaac"
 
-def _load_settings():
-    path = CONFIG_DIR / "settings.json"
-    if path.exists():
-        try:
-            return json.loads(path.read_text())
-        except (json.JSONDecodeError, OSError):
-            pass
-    return {}
+def _dir_size(path):
+    """Total size in bytes of the regular files directly in *path*."""
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+    return total
 
 def _save_settings(settings):
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    (CONFIG_DIR / "settings.json").write_text(
-        json.dumps(settings, indent=2, ensure_ascii=False))
+    path = CONFIG_DIR / "settings.json"
+    # Write to a temporary file first so a crash mid-write never leaves
+    # a truncated settings file behind
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json_helper.dumps(settings, indent=True), encoding="utf-8")
+    os.replace(tmp, path)
 
 
 class Application(Adw.Application):
+    # (action name, handler method, accelerators)
+    _ACTION_SPEC = (
+        ("quit", "quit_app", ("<Primary>q",)),
+        ("about", "show_about", ("F1",)),
+        ("shortcuts", "show_shortcuts", ("<Primary>slash",)),
+        ("preferences", "_on_preferences", ("<Primary>comma",)),
+        ("refresh", "refresh_data", ("F5",)),
+        ("export", "export_schedule", ("<Primary>e",)),
+    )
+
     def __init__(self):
         super().__init__(application_id="se.danielnylander.bildstod")
         GLib.set_application_name(_("Visual Support"))
-        self.settings = _load_settings()
+        # Filled in by _on_settings_loaded once do_startup has read the file
+        self.settings = {}
+        self._settings_loaded = False
+        self._pending_save = 0
+        self._prefs_dialog = None
+        self._prefs_widgets = {}
+        # Shared worker threads for blocking disk work started from the UI
+        self.io_executor = ThreadPoolExecutor(
+            max_workers=max(2, os.cpu_count() or 2),
+            thread_name_prefix="bildstod-io")
+        self._active_window = None
 
     def do_activate(self):
         apply_large_text()
@@ -495,25 +665,41 @@ class Application(Adw.Application):
             window = MainWindow(application=self)
         self._apply_theme()
         window.present()
-        if not self.settings.get("welcome_shown"):
+        if self._settings_loaded and not self.settings.get("welcome_shown"):
             self._show_welcome(window)
 
     def do_startup(self):
         Adw.Application.do_startup(self)
 
-        for name, cb, accel in [
-            ("quit", self.quit_app, ["<Primary>q"]),
-            ("about", self.show_about, ["F1"]),
-            ("shortcuts", self.show_shortcuts, ["<Primary>slash"]),
-            ("preferences", self._on_preferences, ["<Primary>comma"]),
-            ("refresh", self.refresh_data, ["F5"]),
-            ("export", self.export_schedule, ["<Primary>e"]),
-        ]:
+        gfile = Gio.File.new_for_path(str(CONFIG_DIR / "settings.json"))
+        gfile.load_contents_async(None, self._on_settings_loaded)
+
+        self.connect("notify::active-window", self._on_active_window_changed)
+
+        for name, cb_name, accels in self._ACTION_SPEC:
             action = Gio.SimpleAction.new(name, None)
-            action.connect("activate", cb)
+            action.connect("activate", getattr(self, cb_name))
             self.add_action(action)
-            if accel:
-                self.set_accels_for_action(f"app.{name}", accel)
+            if accels:
+                self.set_accels_for_action(f"app.{name}", list(accels))
+
+    def _on_settings_loaded(self, gfile, result):
+        try:
+            ok, data, _etag = gfile.load_contents_finish(result)
+            loaded = json_helper.loads(data)
+        except (GLib.Error, json.JSONDecodeError):
+            loaded = {}
+        if not isinstance(loaded, dict):
+            loaded = {}
+        # Anything changed before the file was read takes precedence
+        loaded.update(self.settings)
+        self.settings = loaded
+        self._settings_loaded = True
+        self._apply_theme()
+
+        window = self.props.active_window
+        if window and not self.settings.get("welcome_shown"):
+            self._show_welcome(window)
 
     def _apply_theme(self):
         theme = self.settings.get("theme", "system")
@@ -564,6 +750,16 @@ class Application(Adw.Application):
         dialog.close()
 
     def _on_preferences(self, *_args):
+        # Build the dialog on first use only; later opens refresh the
+        # existing widgets from the current settings
+        if self._prefs_dialog is None:
+            self._prefs_dialog = self._build_preferences()
+        else:
+            self._sync_prefs_from_settings()
+        self._measure_cache_size()
+        self._prefs_dialog.present(self.props.active_window)
+
+    def _build_preferences(self):
         prefs = Adw.PreferencesDialog()
         prefs.set_title(_("Preferences"))
 
@@ -635,12 +831,8 @@ class Application(Adw.Application):
 
         cache_group = Adw.PreferencesGroup()
         cache_group.set_title(_("ARASAAC Cache"))
-        cache_dir = Path(GLib.get_user_cache_dir()) / "arasaac"
-        cache_size = sum(f.stat().st_size for f in cache_dir.glob("*")
-                         if f.is_file()) if cache_dir.exists() else 0
         cache_row = Adw.ActionRow()
         cache_row.set_title(_("Cached pictograms"))
-        cache_row.set_subtitle(f"{cache_size / (1024*1024):.1f} MB")
         clear_btn = Gtk.Button(label=_("Clear"))
         clear_btn.add_css_class("destructive-action")
         clear_btn.set_valign(Gtk.Align.CENTER)
@@ -670,60 +862,138 @@ class Application(Adw.Application):
         advanced.add(debug_group)
 
         prefs.add(advanced)
-        prefs.present(self.props.active_window)
+
+        self._prefs_widgets = {
+            "theme": theme_row, "icon_size": size_row,
+            "tts_engine": engine_row, "tts_speed": speed_scale,
+            "cache": cache_row, "clear": clear_btn,
+            "notifications": notif_row, "debug": debug_row,
+        }
+        return prefs
+
+    def _sync_prefs_from_settings(self):
+        w = self._prefs_widgets
+        w["theme"].set_selected({"system": 0, "light": 1, "dark": 2}.get(
+            self.settings.get("theme", "system"), 0))
+        w["icon_size"].set_selected({"small": 0, "medium": 1, "large": 2}.get(
+            self.settings.get("icon_size", "medium"), 1))
+        w["tts_engine"].set_selected({"auto": 0, "piper": 1, "espeak": 2}.get(
+            self.settings.get("tts_engine", "auto"), 0))
+        w["tts_speed"].set_value(self.settings.get("tts_speed", 1.0))
+        w["notifications"].set_active(self.settings.get("notifications", True))
+        w["debug"].set_active(self.settings.get("debug", False))
+        w["clear"].set_label(_("Clear"))
+        w["clear"].set_sensitive(True)
+
+    def _measure_cache_size(self):
+        cache_row = self._prefs_widgets["cache"]
+        cache_row.set_subtitle("…")
+
+        # Summing thousands of files can take a while; don't hold up
+        # the dialog for it
+        def measure_cache():
+            size = _dir_size(ARASAAC_CACHE_DIR)
+            GLib.idle_add(cache_row.set_subtitle, f"{size / (1024*1024):.1f} MB")
+
+        self.io_executor.submit(measure_cache)
 
     def _on_theme_changed(self, row, *_):
         themes = {0: "system", 1: "light", 2: "dark"}
         self.settings["theme"] = themes.get(row.get_selected(), "system")
-        _save_settings(self.settings)
+        self._schedule_save()
         self._apply_theme()
 
     def _on_icon_size_changed(self, row, *_):
         sizes = {0: "small", 1: "medium", 2: "large"}
         self.settings["icon_size"] = sizes.get(row.get_selected(), "medium")
-        _save_settings(self.settings)
+        self._schedule_save()
 
     def _on_notif_changed(self, row, *_):
         self.settings["notifications"] = row.get_active()
+        self._schedule_save()
+
+    def _on_tts_engine_changed(self, row, *_):
+        engines = {0: "auto", 1: "piper", 2: "espeak"}
+        self.settings["tts_engine"] = engines.get(row.get_selected(), "auto")
+        self._schedule_save()
+
+    def _on_tts_speed_changed(self, scale):
+        self.settings["tts_speed"] = round(scale.get_value(), 1)
+        self._schedule_save()
+
+    def _schedule_save(self):
+        """Write settings once the user stops changing them.
+
+        Sliders and combo rows emit many change signals per interaction,
+        so writes are coalesced into one after a short pause.
+        """
+        if self._pending_save:
+            GLib.source_remove(self._pending_save)
+        self._pending_save = GLib.timeout_add(300, self._flush_settings)
+
+    def _flush_settings(self):
+        self._pending_save = 0
         _save_settings(self.settings)
+        return False
 
     def _on_clear_cache(self, btn, row):
-        cache_dir = Path(GLib.get_user_cache_dir()) / "arasaac"
-        if cache_dir.exists():
-            for f in cache_dir.glob("*"):
-                if f.is_file():
-                    f.unlink()
-        row.set_subtitle("0.0 MB")
         btn.set_sensitive(False)
+
+        def clear():
+            shutil.rmtree(ARASAAC_CACHE_DIR, ignore_errors=True)
+            ARASAAC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            GLib.idle_add(self._on_cache_cleared, btn, row)
+
+        self.io_executor.submit(clear)
+
+    def _on_cache_cleared(self, btn, row):
+        row.set_subtitle("0.0 MB")
         btn.set_label(_("Cleared"))
+        return False
 
     def _on_debug_changed(self, row, *_):
         self.settings["debug"] = row.get_active()
-        _save_settings(self.settings)
+        self._schedule_save()
+
+    def do_shutdown(self):
+        # Don't lose a change made just before quitting
+        if self._pending_save:
+            GLib.source_remove(self._pending_save)
+            self._flush_settings()
+        # Let queued jobs finish: one may be a template the user just saved
+        self.io_executor.shutdown(wait=True)
+        Adw.Application.do_shutdown(self)
+
+    def _on_active_window_changed(self, *_args):
+        self._active_window = self.props.active_window
+
+    def _get_active_window(self):
+        """The focused window, tracked through notify::active-window."""
+        return self._active_window or self.props.active_window
 
     def quit_app(self, action, param):
         self.quit()
 
     def show_about(self, action, param):
-        window = self.props.active_window
+        window = self._get_active_window()
         if window:
             window.show_about(action, param)
 
     def show_shortcuts(self, action, param):
-        window = self.props.active_window
+        window = self._get_active_window()
         if window:
             window.show_shortcuts(action, param)
 
     def refresh_data(self, action, param):
-        window = self.props.active_window
+        window = self._get_active_window()
         if window:
-            window._set_status(_("Refreshing..."))
+            window._set_status(_REFRESHING)
             window.library_view.refresh()
-            window.schedule_view.refresh()
-            GLib.timeout_add_seconds(1, lambda: window._set_status(_("Ready")))
+            window._queue_refresh()
+            GLib.timeout_add_seconds(1, lambda: window._set_status(_READY))
 
     def export_schedule(self, action, param):
-        window = self.props.active_window
+        window = self._get_active_window()
         if window:
             show_export_dialog(window, window.schedule_view.schedule, window._set_status)
 
@@ -2,21 +2,46 @@
 
 import os
 import gettext
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 _ = gettext.gettext
 
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 gi.require_version('GdkPixbuf', '2.0')
-from gi.repository import Gtk, Adw, Gdk, GdkPixbuf
+from gi.repository import Gtk, Adw, Gdk, GdkPixbuf, GLib
 
 from bildstod.library import get_images_dir
 from bildstod.timer import TimerWidget
 
+_IMAGE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="now-images")
+
+# Files up to this size (pictograms, mostly) are uploaded as they are and
+# scaled by Gtk.Picture when drawn; larger photos are shrunk while decoding
+_DIRECT_LOAD_MAX = 64 * 1024
+
+_escape = GLib.markup_escape_text
+
+_BIG_LABEL_FMT = '<span size="36000" weight="bold">%s</span>'
+_NO_ACTIVITY_MARKUP = _BIG_LABEL_FMT % GLib.markup_escape_text(_("No activity"))
+_ALL_DONE_MARKUP = _BIG_LABEL_FMT % GLib.markup_escape_text(_("All done! 🎉"))
+_TIME_UP_FMT = _("Time's up for: %s")
+
+
+def _display_key(item):
+    """What the Now view shows of *item*, for spotting no-op updates."""
+    if item is None:
+        return None
+    return (item.id, item.label, item.duration, item.image_filename)
+
 
 class NowView(Gtk.Box):
     """Full-screen display of the current activity with timer."""
 
+    # Decoded pictures kept for reuse across activity changes
+    _TEXTURE_CACHE_MAX = 64
+
     def __init__(self, status_callback=None):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=24)
         self.set_halign(Gtk.Align.CENTER)
@@ -32,6 +57,13 @@ class NowView(Gtk.Box):
         self.current_item = None
         self._on_done = None
         self._on_skip = None
+        self._tex_cache = OrderedDict()
+        # Image each picture should show; late decodes for others are dropped
+        self._wanted = {}
+        self._last_display_key = ()
+        self._timer_item = None
+        # get_images_dir() creates the directory on every call
+        self._images_dir = str(get_images_dir())
 
         # Current activity image
         self.activity_image = Gtk.Picture()
@@ -41,9 +73,7 @@ class NowView(Gtk.Box):
 
         # Activity name — big text
         self.activity_label = Gtk.Label(label=_("No activity"))
-        self.activity_label.set_markup(
-            '<span size="36000" weight="bold">' + _("No activity") + '</span>'
-        )
+        self.activity_label.set_markup(_NO_ACTIVITY_MARKUP)
         self.append(self.activity_label)
 
         # Timer
@@ -94,64 +124,106 @@ class NowView(Gtk.Box):
         self._update_display()
 
     def _update_display(self):
-        if not self.current_item:
-            self.activity_label.set_markup(
-                '<span size="36000" weight="bold">' + _("All done! 🎉") + '</span>'
-            )
-            self.activity_image.set_paintable(None)
+        item = self.current_item
+        next_item = (self.schedule.get_next_activity(item)
+                     if item and self.schedule else None)
+        # update_schedule() runs on every schedule change; leave the widgets
+        # alone when neither the current nor the next activity changed
+        key = (_display_key(item), _display_key(next_item))
+        if key == self._last_display_key:
+            return
+        self._last_display_key = key
+
+        if not item:
+            self.activity_label.set_markup(_ALL_DONE_MARKUP)
+            self._set_picture(self.activity_image, "", 256, 256)
             self.timer.stop()
+            self._timer_item = None
             self.done_btn.set_sensitive(False)
             self.next_box.set_visible(False)
             return
 
-        item = self.current_item
         self.done_btn.set_sensitive(True)
 
         # Update image
-        img_path = str(get_images_dir() / item.image_filename) if item.image_filename else ""
-        if img_path and os.path.exists(img_path):
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(img_path, 256, 256, True)
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                self.activity_image.set_paintable(texture)
-            except Exception:
-                self.activity_image.set_paintable(None)
-        else:
-            self.activity_image.set_paintable(None)
+        self._set_picture(self.activity_image, self._image_path(item), 256, 256)
 
         # Update label
-        self.activity_label.set_markup(
-            f'<span size="36000" weight="bold">{GLib_markup_escape(item.label)}</span>'
-        )
+        self.activity_label.set_markup(_BIG_LABEL_FMT % _escape(item.label))
 
-        # Start timer
+        # Start timer, unless it is already counting down this activity
         if item.duration > 0:
-            self.timer.start(item.duration)
+            if self._timer_item is not item:
+                self.timer.start(item.duration)
+                self._timer_item = item
             self.timer.set_visible(True)
         else:
             self.timer.set_visible(False)
 
         # Next activity preview
-        if self.schedule:
-            next_item = self.schedule.get_next_activity(item)
-            if next_item:
-                self.next_box.set_visible(True)
-                self.next_name.set_text(next_item.label)
-                next_img = str(get_images_dir() / next_item.image_filename) if next_item.image_filename else ""
-                if next_img and os.path.exists(next_img):
-                    try:
-                        pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(next_img, 48, 48, True)
-                        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                        self.next_image.set_paintable(texture)
-                    except Exception:
-                        self.next_image.set_paintable(None)
-                else:
-                    self.next_image.set_paintable(None)
-            else:
-                self.next_box.set_visible(False)
+        if next_item:
+            self.next_box.set_visible(True)
+            self.next_name.set_text(next_item.label)
+            next_img = self._image_path(next_item)
+            # Let the current activity's picture go first
+            GLib.idle_add(self._set_picture, self.next_image, next_img, 48, 48,
+                          GLib.PRIORITY_LOW, priority=GLib.PRIORITY_LOW)
         else:
             self.next_box.set_visible(False)
 
+    def _image_path(self, item):
+        if not item.image_filename:
+            return ""
+        return os.path.join(self._images_dir, item.image_filename)
+
+    def _set_picture(self, picture, path, width, height,
+                     priority=GLib.PRIORITY_DEFAULT_IDLE):
+        """Show *path* scaled to fit in *picture*.
+
+        Activities often repeat within a schedule, so textures are kept in
+        a small LRU cache. Anything not cached is decoded on a worker
+        thread so activity changes never wait on the disk; *priority* is
+        the main loop priority its result is shown with.
+        """
+        key = (path, width, height)
+        self._wanted[picture] = key
+        if not path:
+            picture.set_paintable(None)
+            return
+        texture = self._tex_cache.get(key)
+        if texture is not None:
+            self._tex_cache.move_to_end(key)
+            picture.set_paintable(texture)
+            return
+
+        picture.set_paintable(None)
+
+        def decode():
+            try:
+                # A missing image fails to load and leaves the picture empty
+                if os.path.getsize(path) <= _DIRECT_LOAD_MAX:
+                    texture = Gdk.Texture.new_from_filename(path)
+                else:
+                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                        path, width, height, True)
+                    texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+            except Exception:
+                texture = None
+            GLib.idle_add(self._apply_picture, picture, key, texture,
+                          priority=priority)
+
+        _IMAGE_POOL.submit(decode)
+
+    def _apply_picture(self, picture, key, texture):
+        if texture is not None:
+            self._tex_cache[key] = texture
+            if len(self._tex_cache) > self._TEXTURE_CACHE_MAX:
+                self._tex_cache.popitem(last=False)
+        # The activity may have changed while decoding
+        if self._wanted.get(picture) == key:
+            picture.set_paintable(texture)
+        return False
+
     def _on_done_clicked(self, btn):
         if self.current_item:
             self.current_item.done = True
@@ -165,7 +237,7 @@ class NowView(Gtk.Box):
     def _timer_finished(self):
         """Called when timer runs out."""
         if self.status_callback:
-            self.status_callback(_("Time's up for: %s") % (self.current_item.label if self.current_item else ""))
+            self.status_callback(_TIME_UP_FMT % (self.current_item.label if self.current_item else ""))
 
     def _skip_activity(self):
         """Skip to next activity."""
@@ -176,9 +248,3 @@ class NowView(Gtk.Box):
             if self.schedule:
                 self.current_item = self.schedule.get_current_activity()
             self._update_display()
-
-
-def GLib_markup_escape(text):
-    """Escape text for Pango markup."""
-    from gi.repository import GLib
-    return GLib.markup_escape_text(text)
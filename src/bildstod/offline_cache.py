@@ -4,6 +4,7 @@
 Provides intelligent caching and offline functionality for pictogram access.
 """
 
+import hashlib
 import json
 import os
 import sqlite3
@@ -20,6 +21,15 @@ _ = gettext.gettext
 
 from bildstod.library import get_images_dir
 
+# How long cached ARASAAC search responses are considered fresh
+SEARCH_CACHE_TTL_HOURS = 7 * 24
+
+
+def _search_key(query: str, language: str) -> str:
+    """Cache key for a search, insensitive to case and surrounding spaces."""
+    normalized = query.strip().lower()
+    return hashlib.sha1(f"{language}\0{normalized}".encode()).hexdigest()
+
 
 class OfflineCache:
     """Manages offline cache for ARASAAC pictograms."""
@@ -35,13 +45,26 @@ class OfflineCache:
         self.images_dir = self.cache_dir / "images"
         self.images_dir.mkdir(exist_ok=True)
         
+        self._local = threading.local()
         self._init_db()
         self._is_online = None
         self._check_online_thread()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection to the cache database.
+
+        Searches run on worker threads, so each thread keeps its own
+        connection open instead of reconnecting on every lookup.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            self._local.conn = conn
+        return conn
+    
     def _init_db(self):
         """Initialize SQLite database for cache metadata."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS pictograms (
                     id TEXT PRIMARY KEY,
@@ -103,15 +126,17 @@ class OfflineCache:
         """Cache pictogram image and metadata."""
         image_path = self.images_dir / f"arasaac_{pictogram_id}_{size}.png"
         
-        # Save image
-        with open(image_path, "wb") as f:
+        # Save image, replacing any previous copy atomically
+        tmp_path = image_path.with_suffix(".part")
+        with open(tmp_path, "wb") as f:
             f.write(image_data)
+        os.replace(tmp_path, image_path)
         
         # Save metadata
         keywords_json = json.dumps(keywords) if keywords else "[]"
         now = datetime.now().isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO pictograms 
                 (id, keywords, swedish_keyword, cached_at, last_accessed, 
@@ -125,7 +150,7 @@ class OfflineCache:
     def _update_access_stats(self, pictogram_id: str):
         """Update access statistics for pictogram."""
         now = datetime.now().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("""
                 UPDATE pictograms 
                 SET access_count = access_count + 1, last_accessed = ?
@@ -135,13 +160,12 @@ class OfflineCache:
     def cache_search_results(self, query: str, results: List[Dict], 
                            language: str = "sv"):
         """Cache search results for offline access."""
-        import hashlib
-        query_hash = hashlib.md5(f"{query}:{language}".encode()).hexdigest()
+        query_hash = _search_key(query, language)
         
         results_json = json.dumps(results)
         now = datetime.now().isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO search_cache
                 (query_hash, query, results, cached_at, language)
@@ -149,12 +173,12 @@ class OfflineCache:
             """, (query_hash, query, results_json, now, language))
     
     def get_cached_search(self, query: str, language: str = "sv", 
-                         max_age_hours: int = 24) -> Optional[List[Dict]]:
+                         max_age_hours: int = SEARCH_CACHE_TTL_HOURS
+                         ) -> Optional[List[Dict]]:
         """Get cached search results if available and fresh."""
-        import hashlib
-        query_hash = hashlib.md5(f"{query}:{language}".encode()).hexdigest()
+        query_hash = _search_key(query, language)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("""
                 SELECT results, cached_at FROM search_cache
                 WHERE query_hash = ?
@@ -175,7 +199,7 @@ class OfflineCache:
     
     def get_popular_pictograms(self, limit: int = 100) -> List[str]:
         """Get most frequently accessed pictograms for preloading."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("""
                 SELECT id FROM pictograms
                 ORDER BY access_count DESC, last_accessed DESC
@@ -210,7 +234,7 @@ class OfflineCache:
         cutoff_date = datetime.now() - timedelta(days=max_age_days)
         cutoff_str = cutoff_date.isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # Get pictograms to remove (old and not popular)
             cursor = conn.execute("""
                 SELECT id FROM pictograms
@@ -242,17 +266,20 @@ class OfflineCache:
     
     def get_cache_stats(self) -> Dict:
         """Get cache statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM pictograms")
             cached_count = cursor.fetchone()[0]
             
             cursor = conn.execute("SELECT COUNT(*) FROM search_cache")
             search_cache_count = cursor.fetchone()[0]
-            
-            # Calculate total size
-            total_size = 0
-            for image_file in self.images_dir.glob("*.png"):
-                total_size += image_file.stat().st_size
+        
+        # Calculate total size; scandir avoids building a Path and
+        # matching a pattern for every cached image
+        total_size = 0
+        with os.scandir(self.images_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".png") and entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
         
         return {
             "cached_pictograms": cached_count,
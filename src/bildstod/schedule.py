@@ -1,8 +1,12 @@
 """Daily schedule builder for Bildstöd."""
 
-import json
+import functools
+import itertools
 import os
+from operator import attrgetter
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from pathlib import Path
 
@@ -13,20 +17,100 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 gi.require_version('GdkPixbuf', '2.0')
-from gi.repository import Gtk, Adw, Gio, GLib, Gdk, GdkPixbuf
+from gi.repository import Gtk, Adw, Gio, GLib, Gdk, GdkPixbuf, Pango
 
+from bildstod import json_helper
 from bildstod.library import get_config_dir, get_images_dir, PictureLibrary
 
+# Translated once; these are used for every timeline row and addition
+_NO_ACTIVITIES = _("No activities yet.\nAdd from the library or click + to add.")
+_MINUTES_FMT = _("%d minutes")
+_TIME_TOOLTIP = _("Time (HH:MM)")
+_MARK_DONE_TOOLTIP = _("Mark as done")
+_REMOVE_TOOLTIP = _("Remove activity")
+_ADDED_FMT = _("Added: %s")
+
+# Strikethrough for done activities, shared by all their labels
+_STRIKE_ATTRS = Pango.AttrList.new()
+_STRIKE_ATTRS.insert(Pango.attr_strikethrough_new(True))
+
+# Decoded 64px timeline thumbnails keyed by (path, mtime). The same
+# pictogram shows up in many schedules and rows, and a Gdk.Texture can be
+# shared by any number of pictures.
+_THUMB_TEXTURES = OrderedDict()
+_THUMB_TEXTURES_MAX = 256
+
+# Thumbnails missing from the cache are decoded here so building the
+# timeline never waits on PNG decoding
+_THUMB_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="timeline-thumbs")
+
+# Pictures waiting for a thumbnail that is being decoded, by cache key
+_pending_thumbs = {}
+
+
+def _load_timeline_thumbnail(picture, img_path, mtime):
+    """Show the 64px thumbnail of *img_path* in *picture*."""
+    key = (img_path, mtime)
+    texture = _THUMB_TEXTURES.get(key)
+    if texture is not None:
+        _THUMB_TEXTURES.move_to_end(key)
+        picture.set_paintable(texture)
+        return
+    waiting = _pending_thumbs.get(key)
+    if waiting is not None:
+        waiting.append(picture)
+        return
+    _pending_thumbs[key] = [picture]
+
+    def decode():
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(img_path, 64, 64, True)
+            texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        except Exception:
+            texture = None
+        GLib.idle_add(_apply_timeline_thumbnail, key, texture)
+
+    _THUMB_POOL.submit(decode)
+
+
+def _apply_timeline_thumbnail(key, texture):
+    pictures = _pending_thumbs.pop(key, ())
+    if texture is not None:
+        _THUMB_TEXTURES[key] = texture
+        if len(_THUMB_TEXTURES) > _THUMB_TEXTURES_MAX:
+            _THUMB_TEXTURES.popitem(last=False)
+    for picture in pictures:
+        if texture is not None:
+            picture.set_paintable(texture)
+            continue
+        # Unreadable image: swap the picture for a placeholder icon
+        row = picture.get_parent()
+        if row is not None:
+            icon = Gtk.Image.new_from_icon_name("image-missing-symbolic")
+            icon.set_pixel_size(48)
+            row.insert_child_after(icon, picture)
+            row.remove(picture)
+    return False
 
+
+@functools.lru_cache(maxsize=1)
 def get_schedules_dir():
     p = get_config_dir() / "schedules"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+# Serialized fields of a ScheduleItem, in file order
+_ITEM_FIELDS = ("id", "library_id", "label", "image_filename",
+                "time_str", "duration", "done", "category")
+_item_values = attrgetter(*_ITEM_FIELDS)
+
+
 class ScheduleItem:
     """A single activity in a schedule."""
 
+    __slots__ = _ITEM_FIELDS
+
     def __init__(self, library_id="", label="", image_filename="",
                  time_str="08:00", duration=30, done=False, category="other"):
         self.id = str(uuid.uuid4())
@@ -39,16 +123,7 @@ class ScheduleItem:
         self.category = category
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "library_id": self.library_id,
-            "label": self.label,
-            "image_filename": self.image_filename,
-            "time_str": self.time_str,
-            "duration": self.duration,
-            "done": self.done,
-            "category": self.category,
-        }
+        return dict(zip(_ITEM_FIELDS, _item_values(self)))
 
     @classmethod
     def from_dict(cls, d):
@@ -77,22 +152,34 @@ class ScheduleItem:
 class Schedule:
     """A daily schedule containing multiple activities."""
 
+    __slots__ = ("name", "date", "items", "_index")
+
     def __init__(self, name="", schedule_date=None):
         self.name = name or _("New Schedule")
         self.date = schedule_date or date.today().isoformat()
         self.items = []
+        # Position of each item id in self.items
+        self._index = {}
+
+    def _reindex(self):
+        self._index = {}
+        for pos, item in enumerate(self.items):
+            self._index.setdefault(item.id, pos)
 
     def add_item(self, item):
+        self._index.setdefault(item.id, len(self.items))
         self.items.append(item)
 
     def remove_item(self, item_id):
         self.items = [i for i in self.items if i.id != item_id]
+        self._reindex()
 
     def to_dict(self):
         return {
             "name": self.name,
             "date": self.date,
-            "items": [i.to_dict() for i in self.items],
+            "items": [dict(zip(_ITEM_FIELDS, _item_values(i)))
+                      for i in self.items],
         }
 
     @classmethod
@@ -101,21 +188,29 @@ class Schedule:
         s.name = d.get("name", _("New Schedule"))
         s.date = d.get("date", date.today().isoformat())
         s.items = [ScheduleItem.from_dict(i) for i in d.get("items", [])]
+        s._reindex()
         return s
 
-    def save(self, filename=None):
+    def save(self, filename=None, pretty=False):
+        """Write the schedule to the schedules directory and return its path.
+
+        Files are written compactly unless *pretty* is set.
+        """
         if not filename:
             safe_name = self.name.replace(" ", "_").replace("/", "_")
             filename = f"{self.date}_{safe_name}.json"
         path = get_schedules_dir() / filename
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        # Write to a temporary file first so a crash mid-write never leaves
+        # a truncated schedule that load() would reject
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_bytes(
+            json_helper.dumps(self.to_dict(), indent=pretty).encode("utf-8"))
+        os.replace(tmp, path)
         return path
 
     @classmethod
     def load(cls, path):
-        with open(path) as f:
-            return cls.from_dict(json.load(f))
+        return cls.from_dict(json_helper.loads(Path(path).read_bytes()))
 
     def get_current_activity(self):
         """Get the first non-done activity."""
@@ -126,12 +221,12 @@ class Schedule:
 
     def get_next_activity(self, current):
         """Get the activity after current."""
-        found = False
-        for item in self.items:
-            if found and not item.done:
+        pos = self._index.get(current.id)
+        if pos is None:
+            return None
+        for item in itertools.islice(self.items, pos + 1, None):
+            if not item.done:
                 return item
-            if item.id == current.id:
-                found = True
         return None
 
 
@@ -144,6 +239,9 @@ class ScheduleView(Gtk.Box):
         self.schedule = Schedule()
         self.status_callback = status_callback
         self._on_activity_changed = None
+        # Timeline rows keyed by item id, so single edits can update one row
+        self._row_widgets = {}
+        self._current_id = None
 
         # Toolbar
         toolbar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -217,56 +315,84 @@ class ScheduleView(Gtk.Box):
             if child is None:
                 break
             self.timeline_box.remove(child)
+        self._row_widgets = {}
+        self._current_id = None
 
         if not self.schedule.items:
-            placeholder = Gtk.Label(label=_("No activities yet.\nAdd from the library or click + to add."))
+            placeholder = Gtk.Label(label=_NO_ACTIVITIES)
             placeholder.add_css_class("dim-label")
             placeholder.set_vexpand(True)
             placeholder.set_valign(Gtk.Align.CENTER)
             self.timeline_box.append(placeholder)
             return
 
-        current = self.schedule.get_current_activity()
         for item in self.schedule.items:
-            is_current = (current and item.id == current.id)
-            row = self._make_timeline_row(item, is_current)
-            self.timeline_box.append(row)
+            self.timeline_box.append(self._make_timeline_row(item))
+        self._update_current_row()
+
+    def _append_timeline_row(self, item):
+        """Show a newly added item without rebuilding the other rows."""
+        if not self._row_widgets:
+            # Replace the empty-schedule placeholder
+            self._populate_timeline()
+            return
+        self.timeline_box.append(self._make_timeline_row(item))
+        self._update_current_row()
 
-    def _make_timeline_row(self, item, is_current=False):
+    def _update_current_row(self):
+        """Move the current-activity highlight to the first undone item."""
+        current = self.schedule.get_current_activity()
+        current_id = current.id if current else None
+        if current_id == self._current_id:
+            return
+        old_row = self._row_widgets.get(self._current_id)
+        if old_row is not None:
+            old_row.remove_css_class("card")
+            old_row.set_margin_start(6)
+            old_row.set_margin_end(6)
+        new_row = self._row_widgets.get(current_id)
+        if new_row is not None:
+            new_row.add_css_class("card")
+            # Add colored left border via CSS
+            new_row.set_margin_start(2)
+            new_row.set_margin_end(2)
+        self._current_id = current_id
+
+    def _set_row_done(self, row, done):
+        if done:
+            row._time_label.add_css_class("dim-label")
+            row._name_label.add_css_class("dim-label")
+            row._name_label.set_attributes(_STRIKE_ATTRS)
+        else:
+            row._time_label.remove_css_class("dim-label")
+            row._name_label.remove_css_class("dim-label")
+            row._name_label.set_attributes(None)
+
+    def _make_timeline_row(self, item):
         row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         row.set_margin_top(6)
         row.set_margin_bottom(6)
         row.set_margin_start(6)
         row.set_margin_end(6)
 
-        if is_current:
-            row.add_css_class("card")
-            # Add colored left border via CSS
-            row.set_margin_start(2)
-            row.set_margin_end(2)
-
         # Time
         time_label = Gtk.Label(label=item.time_str)
         time_label.set_size_request(60, -1)
         time_label.add_css_class("heading")
-        if item.done:
-            time_label.add_css_class("dim-label")
         row.append(time_label)
 
         # Image thumbnail
         img_path = str(get_images_dir() / item.image_filename) if item.image_filename else ""
-        if img_path and os.path.exists(img_path):
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(img_path, 64, 64, True)
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                picture = Gtk.Picture.new_for_paintable(texture)
-                picture.set_size_request(64, 64)
-                picture.set_content_fit(Gtk.ContentFit.CONTAIN)
-                row.append(picture)
-            except Exception:
-                icon = Gtk.Image.new_from_icon_name("image-missing-symbolic")
-                icon.set_pixel_size(48)
-                row.append(icon)
+        try:
+            mtime = os.stat(img_path).st_mtime if img_path else None
+        except OSError:
+            mtime = None
+        if mtime is not None:
+            picture = Gtk.Picture()
+            picture.set_size_request(64, 64)
+            picture.set_content_fit(Gtk.ContentFit.CONTAIN)
+            row.append(picture)
+            _load_timeline_thumbnail(picture, img_path, mtime)
         else:
             icon = Gtk.Image.new_from_icon_name("emblem-photos-symbolic")
             icon.set_pixel_size(48)
@@ -278,19 +404,9 @@ class ScheduleView(Gtk.Box):
 
         name_label = Gtk.Label(label=item.label, xalign=0)
         name_label.add_css_class("title-3")
-        if item.done:
-            name_label.add_css_class("dim-label")
-            # Strikethrough via attributes
-            attrs = name_label.get_attributes()
-            if attrs is None:
-                from gi.repository import Pango
-                attrs = Pango.AttrList.new()
-            from gi.repository import Pango
-            attrs.insert(Pango.attr_strikethrough_new(True))
-            name_label.set_attributes(attrs)
         info_box.append(name_label)
 
-        dur_label = Gtk.Label(label=_("%d minutes") % item.duration, xalign=0)
+        dur_label = Gtk.Label(label=_MINUTES_FMT % item.duration, xalign=0)
         dur_label.add_css_class("dim-label")
         dur_label.add_css_class("caption")
         info_box.append(dur_label)
@@ -302,24 +418,29 @@ class ScheduleView(Gtk.Box):
         time_entry.set_text(item.time_str)
         time_entry.set_max_width_chars(5)
         time_entry.set_width_chars(5)
-        time_entry.set_tooltip_text(_("Time (HH:MM)"))
+        time_entry.set_tooltip_text(_TIME_TOOLTIP)
         time_entry.connect("changed", self._on_time_changed, item)
         row.append(time_entry)
 
         # Done button
         done_btn = Gtk.CheckButton()
         done_btn.set_active(item.done)
-        done_btn.set_tooltip_text(_("Mark as done"))
+        done_btn.set_tooltip_text(_MARK_DONE_TOOLTIP)
         done_btn.connect("toggled", self._on_done_toggled, item)
         row.append(done_btn)
 
         # Remove button
         remove_btn = Gtk.Button(icon_name="edit-delete-symbolic")
-        remove_btn.set_tooltip_text(_("Remove activity"))
+        remove_btn.set_tooltip_text(_REMOVE_TOOLTIP)
         remove_btn.add_css_class("flat")
         remove_btn.connect("clicked", self._on_remove_item, item)
         row.append(remove_btn)
 
+        row._time_label = time_label
+        row._name_label = name_label
+        if item.done:
+            self._set_row_done(row, True)
+        self._row_widgets[item.id] = row
         return row
 
     def _on_time_changed(self, entry, item):
@@ -327,23 +448,32 @@ class ScheduleView(Gtk.Box):
 
     def _on_done_toggled(self, btn, item):
         item.done = btn.get_active()
-        self._populate_timeline()
+        row = self._row_widgets.get(item.id)
+        if row is not None:
+            self._set_row_done(row, item.done)
+        self._update_current_row()
         self._notify_change()
 
     def _on_remove_item(self, btn, item):
         self.schedule.remove_item(item.id)
-        self._populate_timeline()
+        row = self._row_widgets.pop(item.id, None)
+        if row is not None:
+            self.timeline_box.remove(row)
+        if self.schedule.items:
+            self._update_current_row()
+        else:
+            self._populate_timeline()
         self._notify_change()
 
     def _on_drop(self, target, value, x, y):
         try:
-            data = json.loads(value.get_data().decode())
+            data = json_helper.loads(value.get_data())
             sched_item = ScheduleItem.from_library_item(data)
             self.schedule.add_item(sched_item)
-            self._populate_timeline()
+            self._append_timeline_row(sched_item)
             self._notify_change()
             if self.status_callback:
-                self.status_callback(_("Added: %s") % sched_item.label)
+                self.status_callback(_ADDED_FMT % sched_item.label)
             return True
         except Exception:
             return False
@@ -397,10 +527,10 @@ class ScheduleView(Gtk.Box):
             if selected and hasattr(selected, '_library_item'):
                 sched_item = ScheduleItem.from_library_item(selected._library_item)
                 self.schedule.add_item(sched_item)
-                self._populate_timeline()
+                self._append_timeline_row(sched_item)
                 self._notify_change()
                 if self.status_callback:
-                    self.status_callback(_("Added: %s") % sched_item.label)
+                    self.status_callback(_ADDED_FMT % sched_item.label)
 
     def _on_save(self, btn):
         try:
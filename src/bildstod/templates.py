@@ -4,24 +4,37 @@ Built-in templates include ARASAAC pictogram IDs so that images are
 automatically downloaded and shown when a template is loaded.
 """
 
+import functools
 import json
 import os
+import shutil
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import gettext
 _ = gettext.gettext
 
+from bildstod import json_helper
+from bildstod.http_pool import open_url
 from bildstod.library import get_config_dir, get_images_dir
 from bildstod.schedule import Schedule, ScheduleItem
 
 
+@functools.lru_cache(maxsize=1)
 def get_templates_dir():
     p = get_config_dir() / "templates"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+# Read/write size when streaming pictogram downloads to disk
+_DOWNLOAD_CHUNK = 256 * 1024
+
+# Pictogram downloads are independent and dominated by network latency,
+# so a handful run side by side
+_DOWNLOAD_POOL = ThreadPoolExecutor(max_workers=6, thread_name_prefix="template-images")
+
 # ARASAAC pictogram IDs for common activities
 _ARASAAC_IDS = {
     "Wake up": 8988,
@@ -40,37 +53,78 @@ _ARASAAC_IDS = {
     "Rest": 3299,       # vila
 }
 
+_ARASAAC_FILENAMES = {pid: f"arasaac_{pid}.png" for pid in set(_ARASAAC_IDS.values())}
+
+
+def _arasaac_filename(picto_id):
+    filename = _ARASAAC_FILENAMES.get(picto_id)
+    if filename is None:
+        # User templates may reference pictograms the built-ins don't use
+        filename = f"arasaac_{picto_id}.png"
+    return filename
+
+
+def _cached_image_names():
+    """Return the names of all files currently in the images directory."""
+    try:
+        with os.scandir(get_images_dir()) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
 
 def _ensure_arasaac_image(picto_id):
     """Download an ARASAAC image if not already cached. Returns filename."""
     dest_dir = get_images_dir()
-    filename = f"arasaac_{picto_id}.png"
+    filename = _arasaac_filename(picto_id)
     dest = dest_dir / filename
     if dest.exists():
         return filename
     url = f"https://static.arasaac.org/pictograms/{picto_id}/{picto_id}_500.png"
+    # Stream into a temporary file so a broken download never leaves
+    # a truncated PNG that would later count as cached
+    tmp = dest.with_suffix(f".{threading.get_ident()}.part")
     try:
-        from urllib.request import urlopen, Request
-        req = Request(url, headers={"User-Agent": "Bildstod/0.4.0"})
-        with urlopen(req, timeout=15) as resp:
-            with open(dest, "wb") as f:
-                f.write(resp.read())
+        with open_url(url, timeout=15) as resp:
+            with open(tmp, "wb", buffering=_DOWNLOAD_CHUNK) as f:
+                shutil.copyfileobj(resp, f, _DOWNLOAD_CHUNK)
+        os.replace(tmp, dest)
         return filename
     except Exception:
+        # The temporary name differs per thread, so nothing would ever
+        # overwrite a leftover
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
         return ""
 
 
-def prefetch_template_images():
-    """Download all ARASAAC images used by built-in templates (background)."""
-    def _fetch():
-        for picto_id in set(_ARASAAC_IDS.values()):
-            _ensure_arasaac_image(picto_id)
-    thread = threading.Thread(target=_fetch, daemon=True)
-    thread.start()
+def prefetch_template_images(on_downloaded=None):
+    """Download all ARASAAC images used by built-in templates (background).
+
+    *on_downloaded* is called with the pictogram id after each image that
+    was not already present has been saved. It runs on a download
+    thread, so GTK callers should hand it over with GLib.idle_add.
+    """
+    def _fetch(picto_id):
+        if _ensure_arasaac_image(picto_id) and on_downloaded:
+            on_downloaded(picto_id)
+
+    cached = _cached_image_names()
+    for picto_id, filename in _ARASAAC_FILENAMES.items():
+        if filename not in cached:
+            _DOWNLOAD_POOL.submit(_fetch, picto_id)
 
 
+@functools.lru_cache(maxsize=1)
 def get_builtin_templates():
-    """Return built-in template definitions with ARASAAC image references."""
+    """Return built-in template definitions with ARASAAC image references.
+
+    The definitions are built and translated on the first call, after the
+    application has set up gettext, and the same list is returned from
+    then on. Callers must treat it as read-only.
+    """
     return [
         {
             "name": _("School Day"),
@@ -129,10 +183,11 @@ def template_to_schedule(template_data):
     """Convert a template dict into a Schedule object.
 
     If items have arasaac_id, the corresponding pictogram images are
-    downloaded (in a background thread) and assigned to the schedule items.
+    downloaded (on background threads) and assigned to the schedule items.
     """
     schedule = Schedule(name=template_data["name"])
-    items_needing_images = []
+    items_needing_images = {}
+    cached = _cached_image_names()
     for item_data in template_data["items"]:
         si = ScheduleItem(
             label=item_data["label"],
@@ -143,46 +198,58 @@ def template_to_schedule(template_data):
         arasaac_id = item_data.get("arasaac_id")
         if arasaac_id:
             # Try cached image first (instant)
-            filename = f"arasaac_{arasaac_id}.png"
-            if (get_images_dir() / filename).exists():
+            filename = _arasaac_filename(arasaac_id)
+            if filename in cached:
                 si.image_filename = filename
             else:
-                items_needing_images.append((si, arasaac_id))
+                items_needing_images.setdefault(arasaac_id, []).append(si)
         schedule.add_item(si)
 
-    # Download missing images in background
-    if items_needing_images:
-        def _fetch_images():
-            for sched_item, picto_id in items_needing_images:
-                fname = _ensure_arasaac_image(picto_id)
-                if fname:
-                    sched_item.image_filename = fname
-        thread = threading.Thread(target=_fetch_images, daemon=True)
-        thread.start()
+    # Download missing images in background, once per pictogram
+    def _fetch_image(picto_id, sched_items):
+        fname = _ensure_arasaac_image(picto_id)
+        if fname:
+            for sched_item in sched_items:
+                sched_item.image_filename = fname
+
+    for picto_id, sched_items in items_needing_images.items():
+        _DOWNLOAD_POOL.submit(_fetch_image, picto_id, sched_items)
 
     return schedule
 
 
-def save_as_template(schedule, name=None):
-    """Save a schedule as a user template."""
+def save_as_template(schedule, name=None, pretty=False):
+    """Save a schedule as a user template, compactly unless *pretty* is set."""
     tpl = schedule.to_dict()
     if name:
         tpl["name"] = name
+    return write_template(tpl, pretty)
+
+
+def write_template(tpl, pretty=False):
+    """Write a template dict to the templates directory and return its path.
+
+    Takes a snapshot from Schedule.to_dict(), so it can run on a worker
+    thread while the schedule keeps changing.
+    """
     safe_name = tpl["name"].replace(" ", "_").replace("/", "_")
     path = get_templates_dir() / f"{safe_name}.json"
-    with open(path, "w") as f:
-        json.dump(tpl, f, indent=2, ensure_ascii=False)
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(json_helper.dumps(tpl, indent=pretty).encode("utf-8"))
+    os.replace(tmp, path)
     return path
 
 
 def list_user_templates():
     """List user-saved templates."""
     templates = []
-    for p in get_templates_dir().glob("*.json"):
-        try:
-            with open(p) as f:
-                data = json.load(f)
-            templates.append(data)
-        except (json.JSONDecodeError, IOError):
-            continue
+    with os.scandir(get_templates_dir()) as it:
+        for entry in it:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            try:
+                with open(entry.path, "rb") as f:
+                    templates.append(json_helper.loads(f.read()))
+            except (json.JSONDecodeError, IOError):
+                continue
     return templates
@@ -1,6 +1,9 @@
 """Timer/countdown for current activity in Bildstöd."""
 
+import functools
 import gettext
+import os
+import shutil
 _ = gettext.gettext
 
 import gi
@@ -8,6 +11,81 @@ gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, GLib
 
+try:
+    gi.require_version('GSound', '1.0')
+    from gi.repository import GSound
+except (ValueError, ImportError):
+    GSound = None
+
+# Finish sound, relative to one of the system data directories
+_SOUND_FILE = os.path.join("sounds", "freedesktop", "stereo", "complete.oga")
+
+# Silence the player's output
+_SPAWN_QUIET = [
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+]
+
+# Translated once; the pause button flips between these on every click
+_PAUSE_LABEL = _("Pause")
+_RESUME_LABEL = _("Resume")
+_FINISHED = _("Timer finished!")
+_PAUSE_ICON = "media-playback-pause-symbolic"
+_RESUME_ICON = "media-playback-start-symbolic"
+
+# Countdown colours, from plenty of time left to almost none
+_GREEN = "#2ec27e"
+_YELLOW = "#e5a50a"
+_RED = "#e01b24"
+
+# The digits are spliced between these, so a tick does no formatting
+_TIME_MARKUP_PREFIX = {
+    color: f'<span size="72000" weight="bold" foreground="{color}">'
+    for color in (_GREEN, _YELLOW, _RED)
+}
+_TIME_MARKUP_SUFFIX = "</span>"
+
+# The progress bar carries no other classes, so one set_css_classes call
+# swaps the colour
+_PROGRESS_CLASSES = {_GREEN: ["success"], _YELLOW: ["warning"], _RED: ["error"]}
+
+
+@functools.lru_cache(maxsize=None)
+def _format_remaining(seconds):
+    """Return *seconds* as MM:SS, remembering every value formatted."""
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def _reap_child(pid, status):
+    """Child watch callback; GLib has already reaped the player by now."""
+
+
+@functools.lru_cache(maxsize=1)
+def _paplay_command():
+    """Return the paplay argv for the finish sound, or None if either the
+    player or the sound file is missing."""
+    paplay = shutil.which("paplay")
+    if paplay is None:
+        return None
+    for data_dir in GLib.get_system_data_dirs():
+        sound = os.path.join(data_dir, _SOUND_FILE)
+        if os.path.exists(sound):
+            return [paplay, sound]
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _sound_context():
+    """Return a shared GSound context, or None if GSound can't be used."""
+    if GSound is None:
+        return None
+    ctx = GSound.Context()
+    try:
+        ctx.init()
+    except GLib.Error:
+        return None
+    return ctx
+
 
 class TimerWidget(Gtk.Box):
     """Visual countdown timer with color-changing progress bar."""
@@ -20,15 +98,28 @@ class TimerWidget(Gtk.Box):
 
         self.total_seconds = 0
         self.remaining_seconds = 0
+        # 1 / total_seconds, or 0 for an empty countdown
+        self._inv_total = 0.0
         self.running = False
         self.timer_id = None
+        # Monotonic time (µs) the countdown reaches zero; while paused,
+        # the time that was left instead
+        self._end_us = 0
+        self._paused_left_us = 0
+        # Colour band currently shown, to restyle only when it changes
+        self._last_color = None
+        # (remaining, total) seconds last drawn
+        self._last_shown = None
+        # (time text, colour, fraction) waiting for the next frame
+        self._pending = None
+        self._frame_cb_id = 0
         self._on_finished = None
         self._on_skip = None
 
         # Big time display
-        self.time_label = Gtk.Label(label="00:00")
-        self.time_label.add_css_class("title-1")
-        self.time_label.set_markup('<span size="72000" weight="bold">00:00</span>')
+        self.time_label = Gtk.Label()
+        self.time_label.set_markup(
+            _TIME_MARKUP_PREFIX[_GREEN] + "00:00" + _TIME_MARKUP_SUFFIX)
         self.append(self.time_label)
 
         # Progress bar
@@ -41,8 +132,8 @@ class TimerWidget(Gtk.Box):
         btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         btn_box.set_halign(Gtk.Align.CENTER)
 
-        self.pause_btn = Gtk.Button(label=_("Pause"))
-        self.pause_btn.set_icon_name("media-playback-pause-symbolic")
+        self.pause_btn = Gtk.Button(label=_PAUSE_LABEL)
+        self.pause_btn.set_icon_name(_PAUSE_ICON)
         self.pause_btn.connect("clicked", self._on_pause)
         self.pause_btn.set_size_request(120, 48)
         btn_box.append(self.pause_btn)
@@ -65,29 +156,45 @@ class TimerWidget(Gtk.Box):
         """Start countdown for given minutes."""
         self.total_seconds = int(minutes * 60)
         self.remaining_seconds = self.total_seconds
+        self._inv_total = 1.0 / self.total_seconds if self.total_seconds > 0 else 0.0
+        self._end_us = GLib.get_monotonic_time() + self.total_seconds * 1_000_000
+        self._paused_left_us = 0
         self.running = True
-        self.pause_btn.set_label(_("Pause"))
-        self.pause_btn.set_icon_name("media-playback-pause-symbolic")
+        self.pause_btn.set_label(_PAUSE_LABEL)
+        self.pause_btn.set_icon_name(_PAUSE_ICON)
+        self.pause_btn.set_sensitive(True)
+        self.skip_btn.set_sensitive(True)
         self._update_display()
         if self.timer_id:
             GLib.source_remove(self.timer_id)
-        self.timer_id = GLib.timeout_add(1000, self._tick)
+        self.timer_id = GLib.timeout_add_seconds(1, self._tick)
 
     def stop(self):
         self.running = False
+        self._paused_left_us = 0
+        # Nothing to pause or skip until the next start()
+        self.pause_btn.set_sensitive(False)
+        self.skip_btn.set_sensitive(False)
         if self.timer_id:
             GLib.source_remove(self.timer_id)
             self.timer_id = None
 
     def _tick(self):
         if not self.running:
-            return False
-        self.remaining_seconds -= 1
+            # Paused; the source stays attached until resume or stop()
+            return True
+        # Count against the end time rather than the number of ticks, so
+        # late or coalesced wakeups never make the timer run slow
+        left_us = self._end_us - GLib.get_monotonic_time()
+        self.remaining_seconds = max(0, (left_us + 999_999) // 1_000_000)
         if self.remaining_seconds <= 0:
             self.remaining_seconds = 0
             self.running = False
+            self.timer_id = None
+            self.pause_btn.set_sensitive(False)
             self._update_display()
-            self._play_notification()
+            # The sound is a side effect; let the finish callback run first
+            GLib.idle_add(self._play_notification, priority=GLib.PRIORITY_LOW)
             if self._on_finished:
                 self._on_finished()
             return False
@@ -95,51 +202,62 @@ class TimerWidget(Gtk.Box):
         return True
 
     def _update_display(self):
-        mins = self.remaining_seconds // 60
-        secs = self.remaining_seconds % 60
-        time_str = f"{mins:02d}:{secs:02d}"
+        # A wakeup can land within the same second as the previous one
+        shown = (self.remaining_seconds, self.total_seconds)
+        if shown == self._last_shown:
+            return
+        self._last_shown = shown
+
+        time_str = _format_remaining(self.remaining_seconds)
 
         # Color based on progress
-        if self.total_seconds > 0:
-            fraction = self.remaining_seconds / self.total_seconds
-        else:
-            fraction = 0
+        fraction = self.remaining_seconds * self._inv_total
 
         if fraction > 0.5:
-            color = "#2ec27e"  # green
+            color = _GREEN
         elif fraction > 0.2:
-            color = "#e5a50a"  # yellow
+            color = _YELLOW
         else:
-            color = "#e01b24"  # red
+            color = _RED
+
+        # Apply on the next frame, so updates made in between collapse
+        # into one and the label and bar change together
+        self._pending = (time_str, color, fraction)
+        if not self._frame_cb_id:
+            self._frame_cb_id = self.add_tick_callback(self._apply_pending)
 
+    def _apply_pending(self, widget, frame_clock):
+        self._frame_cb_id = 0
+        time_str, color, fraction = self._pending
         self.time_label.set_markup(
-            f'<span size="72000" weight="bold" foreground="{color}">{time_str}</span>'
-        )
+            _TIME_MARKUP_PREFIX[color] + time_str + _TIME_MARKUP_SUFFIX)
 
-        if self.total_seconds > 0:
-            self.progress.set_fraction(self.remaining_seconds / self.total_seconds)
+        self.progress.set_fraction(fraction)
 
         # Update progress bar CSS for color
-        self.progress.remove_css_class("success")
-        self.progress.remove_css_class("warning")
-        self.progress.remove_css_class("error")
-        if fraction > 0.5:
-            self.progress.add_css_class("success")
-        elif fraction > 0.2:
-            self.progress.add_css_class("warning")
-        else:
-            self.progress.add_css_class("error")
+        if color != self._last_color:
+            self.progress.set_css_classes(_PROGRESS_CLASSES[color])
+            self._last_color = color
+        return False
 
     def _on_pause(self, btn):
+        if not self.running and (self.remaining_seconds <= 0 or
+                                 (self.timer_id is None and not self._paused_left_us)):
+            # The countdown is over or was stopped; there is nothing to resume
+            return
         if self.running:
             self.running = False
-            self.pause_btn.set_label(_("Resume"))
-            self.pause_btn.set_icon_name("media-playback-start-symbolic")
+            self._paused_left_us = self._end_us - GLib.get_monotonic_time()
+            self.pause_btn.set_label(_RESUME_LABEL)
+            self.pause_btn.set_icon_name(_RESUME_ICON)
         else:
             self.running = True
-            self.pause_btn.set_label(_("Pause"))
-            self.pause_btn.set_icon_name("media-playback-pause-symbolic")
-            self.timer_id = GLib.timeout_add(1000, self._tick)
+            self._end_us = GLib.get_monotonic_time() + self._paused_left_us
+            self.pause_btn.set_label(_PAUSE_LABEL)
+            self.pause_btn.set_icon_name(_PAUSE_ICON)
+            # Pausing keeps the tick source; only re-add it after a stop
+            if not self.timer_id:
+                self.timer_id = GLib.timeout_add_seconds(1, self._tick)
 
     def _on_skip_clicked(self, btn):
         self.stop()
@@ -148,16 +266,32 @@ class TimerWidget(Gtk.Box):
 
     def _play_notification(self):
         """Play a system bell / notification sound."""
-        try:
-            import subprocess
-            # Try system bell
-            subprocess.Popen(["paplay", "/usr/share/sounds/freedesktop/stereo/complete.oga"],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except Exception:
+        played = False
+        ctx = _sound_context()
+        if ctx is not None:
+            # Plays in-process from the sound theme, without blocking
+            try:
+                ctx.play_simple({GSound.ATTR_EVENT_ID: "complete"}, None)
+                played = True
+            except GLib.Error:
+                pass
+        command = None if played else _paplay_command()
+        if command is not None:
+            try:
+                # posix_spawn avoids copying the page tables of this
+                # process, which a plain fork would do
+                pid = os.posix_spawn(command[0], command, os.environ,
+                                     file_actions=_SPAWN_QUIET)
+                GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, _reap_child)
+                played = True
+            except OSError:
+                pass
+        if not played:
             try:
                 # Fallback: terminal bell
                 print("\a", end="", flush=True)
             except Exception:
                 pass
         if self.status_callback:
-            self.status_callback(_("Timer finished!"))
+            self.status_callback(_FINISHED)
+        return False
@@ -10,6 +10,7 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import shutil
@@ -194,8 +195,9 @@ def speak(text: str, lang: str = "sv"):
     threading.Thread(target=_do_speak, daemon=True).start()
 
 
-def get_tts_info() -> str:
-    """Return info about available TTS for debug/about dialog."""
+@functools.lru_cache(maxsize=1)
+def _backend_summary() -> str:
+    """Describe the installed TTS backends; probed once per process."""
     piper, voice_dir = _get_piper()
     parts = []
     if piper and voice_dir:
@@ -204,6 +206,11 @@ def get_tts_info() -> str:
     espeak = shutil.which("espeak-ng") or shutil.which("espeak")
     if espeak:
         parts.append("espeak-ng")
+    return ", ".join(parts) if parts else "No TTS"
+
+
+def get_tts_info() -> str:
+    """Return info about available TTS for debug/about dialog."""
     engine = _settings.get("engine", "auto")
     speed = _settings.get("speed", 1.0)
-    return (", ".join(parts) if parts else "No TTS") + f" [engine={engine}, speed={speed}x]"
+    return _backend_summary() + f" [engine={engine}, speed={speed}x]"